@@ -0,0 +1,9 @@
+from .registry import JOB_HANDLERS, JobFailed, register_job, get_handler
+from . import applications, users
+
+__all__ = [
+    'JOB_HANDLERS',
+    'JobFailed',
+    'register_job',
+    'get_handler',
+]
@@ -0,0 +1,34 @@
+from app.models import User
+from app.utils.imports import InvalidImport, import_applications, import_storage, read_rows
+from .registry import JobFailed, register_job
+
+
+@register_job('import_applications')
+def import_applications_job(job):
+    """
+    Import an uploaded CSV/NDJSON file for its user.
+
+    Totals are saved as progress after every committed chunk, so a retry
+    resumes after the last committed row instead of inserting it twice.
+    The upload is removed once the import finishes or cannot be read.
+    """
+    storage = import_storage()
+    path = job.payload['path']
+    user = User.objects.filter(pk=job.payload['user_id']).first()
+    if user is None:
+        storage.delete(path)
+        raise JobFailed('User no longer exists')
+
+    try:
+        with storage.open(path, 'rb') as file:
+            totals = import_applications(
+                user,
+                read_rows(file, job.payload['format']),
+                resume=job.progress.get('totals'),
+                on_chunk=lambda totals: job.update_progress(totals=totals),
+            )
+    except InvalidImport as exc:
+        storage.delete(path)
+        raise JobFailed(str(exc)) from exc
+    storage.delete(path)
+    return totals
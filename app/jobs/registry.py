@@ -0,0 +1,20 @@
+JOB_HANDLERS = {}
+
+
+class JobFailed(Exception):
+    """
+    Raised by a handler for failures that retrying cannot fix. The message
+    is stored in the job's result and may be shown to the job's owner.
+    """
+
+
+def register_job(kind):
+    """Register a function as the handler for jobs of the given kind"""
+    def decorator(func):
+        JOB_HANDLERS[kind] = func
+        return func
+    return decorator
+
+
+def get_handler(kind):
+    return JOB_HANDLERS.get(kind)
@@ -0,0 +1,89 @@
+import logging
+import os
+import socket
+import traceback
+from datetime import timedelta
+
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+
+from app.models import Job
+from .registry import JobFailed, get_handler
+
+logger = logging.getLogger(__name__)
+
+
+def worker_name():
+    return f'{socket.gethostname()}:{os.getpid()}'
+
+
+def claim_job(worker):
+    """Lock the next due job and mark it running; None when the queue is empty"""
+    with transaction.atomic():
+        job = (
+            Job.objects.select_for_update(skip_locked=True)
+            .filter(status=Job.Status.PENDING, run_after__lte=timezone.now())
+            .order_by('run_after', 'id')
+            .first()
+        )
+        if job is None:
+            return None
+        now = timezone.now()
+        job.status = Job.Status.RUNNING
+        job.attempts += 1
+        job.started_at = now
+        job.heartbeat_at = now
+        job.locked_by = worker
+        job.save(update_fields=['status', 'attempts', 'started_at', 'heartbeat_at', 'locked_by'])
+    return job
+
+
+def run_job(job):
+    """Run a claimed job, retrying with backoff until max_attempts"""
+    handler = get_handler(job.kind)
+    try:
+        if handler is None:
+            raise LookupError(f"No handler registered for job kind '{job.kind}'")
+        result = handler(job)
+    except Exception as exc:
+        logger.exception('Job %s (%s) failed', job.id, job.kind)
+        job.error = traceback.format_exc()
+        if isinstance(exc, JobFailed):
+            # Written for the job's owner, unlike the traceback
+            job.result = {'error': str(exc)}
+        retryable = handler is not None and not isinstance(exc, JobFailed)
+        if retryable and job.attempts < job.max_attempts:
+            job.status = Job.Status.PENDING
+            job.run_after = timezone.now() + timedelta(seconds=30 * 2 ** (job.attempts - 1))
+        else:
+            job.status = Job.Status.FAILED
+            job.finished_at = timezone.now()
+        job.save(update_fields=['status', 'error', 'result', 'run_after', 'finished_at'])
+        return False
+
+    job.status = Job.Status.SUCCEEDED
+    job.result = result
+    job.finished_at = timezone.now()
+    job.save(update_fields=['status', 'result', 'finished_at'])
+    return True
+
+
+def requeue_stale_jobs(stale_after):
+    """Put RUNNING jobs whose worker stopped heartbeating back in the queue"""
+    cutoff = timezone.now() - timedelta(seconds=stale_after)
+    return Job.objects.filter(status=Job.Status.RUNNING, heartbeat_at__lt=cutoff).update(
+        status=Job.Status.PENDING, locked_by='',
+    )
+
+
+def run_pending(worker, limit=None):
+    """Run due jobs until the queue is empty or limit jobs have run"""
+    processed = 0
+    while limit is None or processed < limit:
+        close_old_connections()
+        job = claim_job(worker)
+        if job is None:
+            break
+        run_job(job)
+        processed += 1
+    return processed
@@ -0,0 +1,42 @@
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+from app.models import Application, AuditLog, AuditRollup, Profile, User
+from app.utils.application_summary import deferred_summaries
+from app.utils.changes import deferred_tombstones
+from .registry import register_job
+from .utils import delete_in_batches
+
+
+@register_job('delete_user')
+def delete_user(job):
+    """
+    Delete a user and everything that cascades from it in batches.
+
+    The heavy child tables are emptied chunk by chunk first, so the final
+    user.delete() only has a handful of rows left to collect. Safe to re-run
+    after a crash: each step just finds fewer rows.
+    """
+    user_id = job.payload['user_id']
+    batch_size = job.payload.get('batch_size', 5000)
+    deleted = job.progress.get('deleted', {})
+
+    steps = (
+        ('audit_logs', AuditLog.objects.filter(user_id=user_id)),
+        ('audit_rollups', AuditRollup.objects.filter(user_id=user_id)),
+        ('applications', Application.objects.filter(user_id=user_id)),
+        ('blacklisted_tokens', BlacklistedToken.objects.filter(token__user_id=user_id)),
+        ('outstanding_tokens', OutstandingToken.objects.filter(user_id=user_id)),
+        ('profile', Profile.objects.filter(user_id=user_id)),
+    )
+    # One summary rebuild at the end instead of an update per deleted application,
+    # and no tombstones: they would be deleted along with the user
+    with deferred_summaries(), deferred_tombstones(record=False):
+        for step, queryset in steps:
+            def report(count, step=step, base=deleted.get(step, 0)):
+                deleted[step] = base + count
+                job.update_progress(step=step, deleted=deleted)
+            delete_in_batches(queryset, batch_size, on_batch=report)
+
+    User.objects.filter(pk=user_id).delete()
+    job.update_progress(step='done', deleted=deleted)
+    return {'deleted_user_id': user_id, 'deleted': deleted}
@@ -0,0 +1,18 @@
+def delete_in_batches(queryset, batch_size, on_batch=None):
+    """
+    Delete the rows of a queryset in primary-key chunks.
+
+    Each chunk is its own short DELETE, so no single statement holds locks
+    over the whole set. on_batch is called with the running total after
+    every chunk. Returns the number of rows deleted.
+    """
+    model = queryset.model
+    deleted = 0
+    while True:
+        ids = list(queryset.order_by('pk').values_list('pk', flat=True)[:batch_size])
+        if not ids:
+            return deleted
+        model.objects.filter(pk__in=ids).delete()
+        deleted += len(ids)
+        if on_batch:
+            on_batch(deleted)
@@ -0,0 +1,117 @@
+import asyncio
+import secrets
+import time
+from collections import Counter
+
+from asgiref.sync import ThreadSensitiveContext
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.test import AsyncClient, override_settings
+
+from app.models import User
+
+# Cheap authenticated endpoint timed while the logins run
+PROBE_PATH = '/api/auth/check/'
+
+
+class Command(BaseCommand):
+    help = (
+        'Drives a burst of /api/login/ requests through the ASGI handler and measures '
+        'their throughput and latency, and the latency of unrelated requests meanwhile'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--concurrency', type=int, default=16, help='Simultaneous login clients')
+        parser.add_argument('--requests', type=int, default=200, help='Logins in total')
+        parser.add_argument('--probe-interval', type=float, default=0.05,
+                            help='Seconds between probe requests to an unrelated endpoint')
+        parser.add_argument('--compare', action='store_true',
+                            help='Also run with the hashing pool disabled, for comparison')
+
+    def handle(self, *args, **options):
+        password = secrets.token_urlsafe(16)
+        # Committed, since requests run on their own threads and database connections
+        user = User.objects.create_user(
+            username='benchmark-login', email='benchmark-login@example.com', password=password,
+        )
+        # The login throttle would turn the burst into 429s
+        rates = {
+            scope: rate for scope, rate in settings.REST_FRAMEWORK.get('DEFAULT_THROTTLE_RATES', {}).items()
+            if scope != 'login'
+        }
+        try:
+            with override_settings(
+                ALLOWED_HOSTS=['testserver'],
+                REST_FRAMEWORK={**settings.REST_FRAMEWORK, 'DEFAULT_THROTTLE_RATES': rates},
+            ):
+                modes = [False, True] if options['compare'] else [settings.PASSWORD_HASHING['ENABLED']]
+                for enabled in modes:
+                    with override_settings(PASSWORD_HASHING={**settings.PASSWORD_HASHING, 'ENABLED': enabled}):
+                        asyncio.run(self.run(user.email, password, options,
+                                             'hashing pool' if enabled else 'no hashing pool'))
+        finally:
+            user.delete()
+
+    async def run(self, email, password, options, label):
+        concurrency, total = options['concurrency'], options['requests']
+        credentials = {'email': email, 'password': password}
+
+        probe = AsyncClient()
+        await probe.post('/api/login/', credentials, content_type='application/json')
+        baseline = [await self.timed_probe(probe) for _ in range(20)]
+
+        login_latencies, statuses = [], Counter()
+        probe_latencies = []
+        burst_done = asyncio.Event()
+
+        async def client(count):
+            c = AsyncClient()
+            for _ in range(count):
+                start = time.perf_counter()
+                async with ThreadSensitiveContext():
+                    response = await c.post('/api/login/', credentials, content_type='application/json')
+                login_latencies.append(time.perf_counter() - start)
+                statuses[response.status_code] += 1
+
+        async def prober():
+            while not burst_done.is_set():
+                probe_latencies.append(await self.timed_probe(probe))
+                await asyncio.sleep(options['probe_interval'])
+
+        per_client = [total // concurrency + (i < total % concurrency) for i in range(concurrency)]
+        probing = asyncio.create_task(prober())
+        start = time.perf_counter()
+        await asyncio.gather(*(client(count) for count in per_client))
+        wall = time.perf_counter() - start
+        burst_done.set()
+        await probing
+
+        self.stdout.write(self.style.MIGRATE_HEADING(f'{label}: {total} logins, {concurrency} concurrent'))
+        self.stdout.write(f'  throughput: {total / wall:.1f} logins/s')
+        self.stdout.write(f'  login latency ms: {self.summary(login_latencies)}')
+        self.stdout.write(f"  status codes: {', '.join(f'{code}: {n}' for code, n in sorted(statuses.items()))}")
+        self.stdout.write(f'  {PROBE_PATH} idle ms: {self.summary(baseline)}')
+        self.stdout.write(f'  {PROBE_PATH} during burst ms: {self.summary(probe_latencies)}')
+
+    @staticmethod
+    async def timed_probe(client):
+        start = time.perf_counter()
+        # One per request, as the ASGI handler does; otherwise every sync view shares a thread
+        async with ThreadSensitiveContext():
+            await client.get(PROBE_PATH)
+        return time.perf_counter() - start
+
+    @staticmethod
+    def summary(latencies):
+        if not latencies:
+            return 'no samples'
+        latencies = sorted(latencies)
+
+        def percentile(p):
+            return latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000
+
+        return (
+            f'p50 {percentile(0.5):.0f}, p95 {percentile(0.95):.0f}, '
+            f'p99 {percentile(0.99):.0f}, max {latencies[-1] * 1000:.0f} ({len(latencies)} samples)'
+        )
@@ -0,0 +1,81 @@
+import time
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from app.models import Application, User
+from app.serializers.application import (
+    APPLICATION_VALUE_FIELDS, ApplicationSerializer, serialize_application_values,
+)
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = 'Compares ApplicationSerializer with the values() fast path for list pages'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=100, help='Rows per page')
+        parser.add_argument('--repeat', type=int, default=200, help='Pages serialized per measurement')
+        parser.add_argument('--user', type=int, default=None,
+                            help="Benchmark this user's applications instead of generated rows")
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                if options['user'] is None:
+                    user = self.make_fixture(options['rows'])
+                else:
+                    user = User.objects.filter(pk=options['user']).first()
+                    if user is None:
+                        raise CommandError(f"User {options['user']} does not exist")
+                self.run(user, options['rows'], options['repeat'])
+                # Never keep the generated fixture
+                raise Rollback
+        except Rollback:
+            pass
+
+    def make_fixture(self, rows):
+        user = User.objects.create_user(username='benchmark-serializers', email='benchmark-serializers@example.com')
+        today = date.today()
+        Application.objects.bulk_create([
+            Application(
+                user=user, company=f'Company {i}', position=f'Position {i}',
+                applied_date=today - timedelta(days=i), status=Application.Status.values[i % 4],
+                interview_date=today + timedelta(days=i) if i % 2 else None,
+                follow_up_date=today if i % 3 else None, salary=1000 * i if i % 5 else None,
+                job_type=Application.JobType.values[i % 4],
+            )
+            for i in range(rows)
+        ])
+        return user
+
+    def run(self, user, rows, repeat):
+        # Each call clones the queryset, so every page is a fresh query
+        page = Application.objects.filter(user=user).order_by('-applied_date', '-id')[:rows]
+        renderer = JSONRenderer()
+
+        def model_path():
+            return ApplicationSerializer(page.all(), many=True).data
+
+        def values_path():
+            return serialize_application_values(page.values(*APPLICATION_VALUE_FIELDS))
+
+        reference, fast = renderer.render(model_path()), renderer.render(values_path())
+        if reference != fast:
+            raise CommandError('Fast path output differs from ApplicationSerializer')
+        self.stdout.write(f'Output identical: {len(reference)} bytes for {len(model_path())} rows')
+
+        timings = {}
+        for name, func in (('ApplicationSerializer', model_path), ('values() fast path', values_path)):
+            start = time.perf_counter()
+            for _ in range(repeat):
+                renderer.render(func())
+            timings[name] = (time.perf_counter() - start) / repeat * 1000
+            self.stdout.write(f'{name:>22}: {timings[name]:.3f} ms/page')
+        speedup = timings['ApplicationSerializer'] / timings['values() fast path']
+        self.stdout.write(self.style.SUCCESS(f'Speedup: {speedup:.2f}x'))
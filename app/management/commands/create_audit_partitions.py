@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand, CommandError
+from app.utils.audit_partitions import ensure_partitions, is_partitioned
+
+class Command(BaseCommand):
+    help = 'Creates monthly audit_log partitions ahead of time'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--months-ahead', type=int, default=3,
+                            help='Number of months after the current one to create partitions for')
+
+    def handle(self, *args, **options):
+        if not is_partitioned():
+            raise CommandError('audit_log is not a partitioned table (PostgreSQL only).')
+
+        created = ensure_partitions(options['months_ahead'])
+        for name in created:
+            self.stdout.write(self.style.SUCCESS(f'Created partition {name}.'))
+        if not created:
+            self.stdout.write(self.style.SUCCESS('All partitions already exist.'))
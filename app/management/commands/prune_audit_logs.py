@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand
+from app.utils.audit_partitions import (
+    delete_before, drop_partition, is_partitioned, list_partitions, month_start,
+)
+from django.utils import timezone
+
+class Command(BaseCommand):
+    help = 'Drops or archives audit_log partitions older than the retention period'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--retain-months', type=int, default=12,
+                            help='Number of whole months to keep, not counting the current one')
+        parser.add_argument('--archive-dir',
+                            help='Write each partition to DIR/<partition>.csv.gz before dropping it')
+        parser.add_argument('--dry-run', action='store_true',
+                            help='Only list what would be removed')
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+        cutoff = month_start(now.year, now.month - options['retain_months'])
+
+        if not is_partitioned():
+            # Plain table: fall back to batched deletes
+            if options['dry_run']:
+                self.stdout.write(f'Would delete audit logs older than {cutoff:%Y-%m-%d}.')
+                return
+            deleted = delete_before(cutoff)
+            self.stdout.write(self.style.SUCCESS(f'Deleted {deleted} audit log(s) older than {cutoff:%Y-%m-%d}.'))
+            return
+
+        expired = [name for name, _, end in list_partitions() if end <= cutoff]
+        if not expired:
+            self.stdout.write(self.style.SUCCESS('No partitions past the retention period.'))
+            return
+
+        for name in expired:
+            if options['dry_run']:
+                self.stdout.write(f'Would drop partition {name}.')
+                continue
+            archive_path = drop_partition(name, archive_dir=options['archive_dir'])
+            if archive_path:
+                self.stdout.write(self.style.SUCCESS(f'Archived {name} to {archive_path} and dropped it.'))
+            else:
+                self.stdout.write(self.style.SUCCESS(f'Dropped partition {name}.'))
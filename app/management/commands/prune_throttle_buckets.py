@@ -0,0 +1,14 @@
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from app.utils.throttling import prune_buckets
+
+class Command(BaseCommand):
+    help = 'Deletes idle throttle buckets kept by the database throttling backend'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--idle-hours', type=int, default=24,
+                            help='Delete buckets not used for IDLE_HOURS hours')
+
+    def handle(self, *args, **options):
+        deleted = prune_buckets(timedelta(hours=options['idle_hours']))
+        self.stdout.write(self.style.SUCCESS(f'Deleted {deleted} throttle bucket(s).'))
@@ -0,0 +1,15 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from app.utils.changes import prune_tombstones
+
+class Command(BaseCommand):
+    help = 'Deletes application tombstones older than the delta-sync retention window'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--retention-days', type=int,
+                            default=settings.APPLICATION_CHANGES['TOMBSTONE_RETENTION_DAYS'],
+                            help='Keep tombstones from the last RETENTION_DAYS days')
+
+    def handle(self, *args, **options):
+        deleted = prune_tombstones(options['retention_days'])
+        self.stdout.write(self.style.SUCCESS(f'Deleted {deleted} application tombstone(s).'))
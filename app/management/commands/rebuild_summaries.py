@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+from app.models import User
+from app.utils.application_summary import rebuild_summaries
+
+class Command(BaseCommand):
+    help = 'Recomputes per-user application summaries from the application table'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500,
+                            help='Number of users rebuilt per transaction')
+        parser.add_argument('--user', type=int, action='append', dest='user_ids',
+                            help='Only rebuild this user id (repeatable)')
+
+    def handle(self, *args, **options):
+        users = User.objects.order_by('pk')
+        if options['user_ids']:
+            users = users.filter(pk__in=options['user_ids'])
+
+        total = 0
+        last_id = 0
+        while True:
+            user_ids = list(users.filter(pk__gt=last_id).values_list('pk', flat=True)[:options['batch_size']])
+            if not user_ids:
+                break
+            total += rebuild_summaries(user_ids)
+            last_id = user_ids[-1]
+
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt {total} application summary(ies).'))
@@ -0,0 +1,41 @@
+import time
+
+from django.core.management.base import BaseCommand
+from app.utils.audit_rollup import fold_audit_logs, prune_hourly_rollups
+
+class Command(BaseCommand):
+    help = 'Folds new audit log rows into the hourly and daily audit rollups'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=50000,
+                            help='Maximum number of audit log rows folded per transaction')
+        parser.add_argument('--settle-seconds', type=int, default=60,
+                            help='Leave rows younger than this for the next run')
+        parser.add_argument('--hourly-retention-days', type=int, default=None,
+                            help='Delete hourly buckets older than this many days')
+        parser.add_argument('--interval', type=float, default=None,
+                            help='Keep running, folding every INTERVAL seconds')
+
+    def handle(self, *args, **options):
+        while True:
+            total = 0
+            # Drain everything that has settled, one batch per transaction
+            while True:
+                folded = fold_audit_logs(
+                    batch_size=options['batch_size'],
+                    settle_seconds=options['settle_seconds'],
+                )
+                if not folded:
+                    break
+                total += folded
+
+            if options['hourly_retention_days'] is not None:
+                deleted = prune_hourly_rollups(options['hourly_retention_days'])
+                if deleted:
+                    self.stdout.write(f'Deleted {deleted} expired hourly rollup(s).')
+
+            self.stdout.write(self.style.SUCCESS(f'Folded {total} audit log row(s) into rollups.'))
+
+            if options['interval'] is None:
+                return
+            time.sleep(options['interval'])
@@ -0,0 +1,31 @@
+import time
+
+from django.core.management.base import BaseCommand
+from app.jobs.runner import requeue_stale_jobs, run_pending, worker_name
+
+class Command(BaseCommand):
+    help = 'Runs queued background jobs'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true',
+                            help='Run every due job, then exit')
+        parser.add_argument('--sleep', type=float, default=2.0,
+                            help='Seconds to wait when the queue is empty')
+        parser.add_argument('--stale-after', type=int, default=600,
+                            help='Requeue running jobs without a heartbeat for this many seconds')
+
+    def handle(self, *args, **options):
+        worker = worker_name()
+        self.stdout.write(f'Job worker {worker} started.')
+        while True:
+            requeued = requeue_stale_jobs(options['stale_after'])
+            if requeued:
+                self.stdout.write(self.style.WARNING(f'Requeued {requeued} stale job(s).'))
+
+            processed = run_pending(worker)
+            if processed:
+                self.stdout.write(self.style.SUCCESS(f'Ran {processed} job(s).'))
+
+            if options['once']:
+                return
+            time.sleep(options['sleep'])
@@ -1,6 +1,6 @@
 from django.utils.functional import SimpleLazyObject
 from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
-from rest_framework_simplejwt.authentication import JWTAuthentication
+from app.utils.authentication import CookieJWTAuthentication
 from django.http import JsonResponse
 
 class TokenExpirationMiddleware:
@@ -10,7 +10,7 @@ class TokenExpirationMiddleware:
     """
     def __init__(self, get_response):
         self.get_response = get_response
-        self.jwt_auth = JWTAuthentication()
+        self.jwt_auth = CookieJWTAuthentication()
 
     def __call__(self, request):
         # Only check on API routes to avoid unnecessary processing
@@ -26,8 +26,8 @@ class TokenExpirationMiddleware:
             # Check if both tokens exist
             if access_token and refresh_token:
                 try:
-                    # Validate the access token
-                    self.jwt_auth.get_validated_token(access_token)
+                    # Validate the access token once; CookieJWTAuthentication reuses it
+                    request.validated_access_token = self.jwt_auth.get_validated_token(access_token)
                     # Token is valid, continue with the request
                     return self.get_response(request)
                 except (InvalidToken, TokenError):
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.2 on 2026-10-18 07:10
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0004_auditlog_timestamp_default'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AuditRollupCheckpoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('last_log_id', models.BigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'audit_rollup_checkpoint',
+            },
+        ),
+        migrations.CreateModel(
+            name='AuditRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('granularity', models.CharField(choices=[('hour', 'Hour'), ('day', 'Day')], max_length=4)),
+                ('bucket', models.DateTimeField()),
+                ('action', models.CharField(choices=[('LOGIN', 'Login'), ('LOGOUT', 'Logout'), ('API_CALL', 'API Call'), ('ROLE_CHANGE', 'Role Change'), ('USER_UPDATE', 'User Update'), ('USER_DELETE', 'User Delete')], max_length=50)),
+                ('endpoint', models.CharField(blank=True, max_length=255)),
+                ('status_class', models.PositiveSmallIntegerField(default=0)),
+                ('count', models.PositiveIntegerField(default=0)),
+                ('total_response_time', models.FloatField(default=0)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='audit_rollups', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'audit_rollup',
+                'indexes': [models.Index(fields=['granularity', 'bucket'], name='audit_rollu_granula_5401fa_idx'), models.Index(fields=['granularity', 'action', 'bucket'], name='audit_rollu_granula_69cf94_idx')],
+                'constraints': [models.UniqueConstraint(fields=('granularity', 'bucket', 'user', 'action', 'endpoint', 'status_class'), name='audit_rollup_unique_bucket')],
+            },
+        ),
+    ]
@@ -0,0 +1,97 @@
+from datetime import datetime, timezone
+
+from django.db import migrations
+
+
+def month_start(year, month):
+    year += (month - 1) // 12
+    month = (month - 1) % 12 + 1
+    return datetime(year, month, 1, tzinfo=timezone.utc)
+
+
+def partition_audit_log(apps, schema_editor):
+    """
+    Rebuild audit_log as a table range-partitioned by month on "timestamp".
+
+    PostgreSQL only; other backends keep the plain table. Existing indexes
+    and foreign keys are recreated under their original names so later
+    schema migrations keep working. The primary key becomes (id, "timestamp")
+    because a partitioned table's unique constraints must include the
+    partition key; ids still come from a single sequence.
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT relkind FROM pg_class WHERE oid = to_regclass('audit_log')")
+        if cursor.fetchone()[0] == 'p':
+            return
+
+        cursor.execute(
+            """
+            SELECT pg_get_indexdef(indexrelid)
+            FROM pg_index
+            WHERE indrelid = 'audit_log'::regclass AND NOT indisprimary
+            """
+        )
+        index_defs = [row[0] for row in cursor.fetchall()]
+        cursor.execute(
+            """
+            SELECT conname, pg_get_constraintdef(oid)
+            FROM pg_constraint
+            WHERE conrelid = 'audit_log'::regclass AND contype = 'f'
+            """
+        )
+        foreign_keys = cursor.fetchall()
+        cursor.execute('SELECT MIN("timestamp"), MAX(id) FROM audit_log')
+        oldest, max_id = cursor.fetchone()
+
+        cursor.execute(
+            'CREATE TABLE audit_log_partitioned (LIKE audit_log INCLUDING DEFAULTS) '
+            'PARTITION BY RANGE ("timestamp")'
+        )
+        cursor.execute('CREATE SEQUENCE audit_log_partitioned_id_seq OWNED BY audit_log_partitioned.id')
+        cursor.execute("SELECT setval('audit_log_partitioned_id_seq', %s, false)", [(max_id or 0) + 1])
+        cursor.execute(
+            "ALTER TABLE audit_log_partitioned "
+            "ALTER COLUMN id SET DEFAULT nextval('audit_log_partitioned_id_seq')"
+        )
+        cursor.execute(
+            'ALTER TABLE audit_log_partitioned '
+            'ADD CONSTRAINT audit_log_partitioned_pkey PRIMARY KEY (id, "timestamp")'
+        )
+        cursor.execute('CREATE TABLE audit_log_default PARTITION OF audit_log_partitioned DEFAULT')
+
+        # Monthly partitions from the oldest row through three months ahead
+        now = datetime.now(timezone.utc)
+        start = month_start((oldest or now).year, (oldest or now).month)
+        last = month_start(now.year, now.month + 3)
+        while start <= last:
+            end = month_start(start.year, start.month + 1)
+            cursor.execute(
+                f'CREATE TABLE audit_log_p{start:%Y_%m} PARTITION OF audit_log_partitioned '
+                f'FOR VALUES FROM (%s) TO (%s)',
+                [start, end],
+            )
+            start = end
+
+        cursor.execute('INSERT INTO audit_log_partitioned SELECT * FROM audit_log')
+        cursor.execute('DROP TABLE audit_log')
+        cursor.execute('ALTER TABLE audit_log_partitioned RENAME TO audit_log')
+        cursor.execute('ALTER SEQUENCE audit_log_partitioned_id_seq RENAME TO audit_log_id_seq')
+        cursor.execute('ALTER TABLE audit_log RENAME CONSTRAINT audit_log_partitioned_pkey TO audit_log_pkey')
+        for index_def in index_defs:
+            cursor.execute(index_def)
+        for name, definition in foreign_keys:
+            cursor.execute(f'ALTER TABLE audit_log ADD CONSTRAINT {name} {definition}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0006_auditlog_timestamp_id_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_audit_log, migrations.RunPython.noop),
+    ]
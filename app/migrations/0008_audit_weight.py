@@ -0,0 +1,31 @@
+# Generated by Django 5.2.2 on 2026-10-18 07:14
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def backfill_rollup_weight(apps, schema_editor):
+    # Rollups folded before sampling existed count every call once
+    AuditRollup = apps.get_model('app', 'AuditRollup')
+    AuditRollup.objects.update(weight=F('count'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0007_partition_audit_log'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='auditlog',
+            name='weight',
+            field=models.FloatField(default=1.0),
+        ),
+        migrations.AddField(
+            model_name='auditrollup',
+            name='weight',
+            field=models.FloatField(default=0),
+        ),
+        migrations.RunPython(backfill_rollup_weight, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.2 on 2026-10-18 07:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0010_job'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['user', 'status', 'interview_date'], name='application_user_id_d4eecc_idx'),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.2 on 2026-10-18 07:20
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0011_application_status_interview_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserApplicationSummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('total', models.PositiveIntegerField(default=0)),
+                ('status_counts', models.JSONField(blank=True, default=dict)),
+                ('job_type_counts', models.JSONField(blank=True, default=dict)),
+                ('salary_sums', models.JSONField(blank=True, default=dict)),
+                ('salary_counts', models.JSONField(blank=True, default=dict)),
+                ('next_interview_date', models.DateField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='application_summary', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'user_application_summary',
+            },
+        ),
+    ]
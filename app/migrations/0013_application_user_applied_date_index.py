@@ -0,0 +1,17 @@
+# Generated by Django 5.2.2 on 2026-10-18 07:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0012_user_application_summary'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['user', 'applied_date', 'id'], name='application_user_id_1d466b_idx'),
+        ),
+    ]
@@ -0,0 +1,51 @@
+from django.db import migrations
+
+SEARCH_INDEXES = {
+    'application_company_trgm': 'company',
+    'application_position_trgm': 'position',
+}
+
+
+def create_trigram_indexes(apps, schema_editor):
+    """
+    GIN trigram indexes on UPPER(company) and UPPER(position).
+
+    These serve the UPPER(col) LIKE UPPER('%q%') that icontains compiles to
+    on PostgreSQL. Skipped on other backends and on servers without the
+    pg_trgm extension available; search then falls back to a scan.
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        if cursor.fetchone() is None:
+            return
+        cursor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        for name, column in SEARCH_INDEXES.items():
+            cursor.execute(
+                f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} '
+                f'ON application USING gin (UPPER({column}) gin_trgm_ops)'
+            )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        for name in SEARCH_INDEXES:
+            cursor.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('app', '0013_application_user_applied_date_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
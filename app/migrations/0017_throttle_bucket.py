@@ -0,0 +1,24 @@
+# Generated by Django 5.2.2 on 2026-10-18 07:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0016_application_change_tracking'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ThrottleBucket',
+            fields=[
+                ('key', models.CharField(max_length=255, primary_key=True, serialize=False)),
+                ('tokens', models.FloatField()),
+                ('updated_at', models.DateTimeField(db_index=True)),
+            ],
+            options={
+                'db_table': 'throttle_bucket',
+            },
+        ),
+    ]
@@ -1,10 +1,12 @@
 from .api import APIResponse
 from .object_manager import ObjectManager
 from .audit import AuditMixin, audit_api_call
+from .conditional import conditional_get
 
 __all__ = [
     'APIResponse',
     'ObjectManager', 
     'AuditMixin',
-    'audit_api_call'
+    'audit_api_call',
+    'conditional_get',
 ] 
\ No newline at end of file
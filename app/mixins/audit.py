@@ -1,52 +1,85 @@
 import time
 from functools import wraps
+from django.conf import settings
 from app.models import AuditLog
+from app.utils.audit_buffer import write_audit_log
+from app.utils.audit_policy import resolve_policy
+
+
+def get_client_ip(request):
+    """
+    Get the client IP: the X-Forwarded-For entry appended by the outermost of
+    settings.TRUSTED_PROXIES proxies, or REMOTE_ADDR. Entries left of it are
+    client-supplied and could be anything.
+    """
+    trusted = settings.TRUSTED_PROXIES
+    x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
+    if trusted and x_forwarded_for:
+        hops = [hop.strip() for hop in x_forwarded_for.split(',')]
+        # Fewer hops than proxies: the header did not come through all of them
+        if len(hops) >= trusted:
+            return hops[-trusted]
+    return request.META.get('REMOTE_ADDR')
+
+
+def record_api_call(request, response, start_time, ip, policy=None):
+    """Queue an audit record for an authenticated API call, subject to its audit policy"""
+    if not (hasattr(request, 'user') and request.user.is_authenticated):
+        return
+
+    response_time = time.time() - start_time
+
+    # Determine action type
+    action = AuditLog.ActionType.API_CALL
+    if request.path.endswith('/login/') and request.method == 'POST':
+        action = AuditLog.ActionType.LOGIN
+    elif request.path.endswith('/logout/') and request.method == 'POST':
+        action = AuditLog.ActionType.LOGOUT
+
+    # Security-relevant actions are always logged in full
+    weight = 1.0
+    if action not in AuditLog.SECURITY_ACTIONS and policy is not None:
+        weight = policy.weight(response.status_code, response_time)
+        if weight is None:
+            return
+
+    # Log the activity off the request's critical path
+    write_audit_log(AuditLog(
+        user_id=request.user.pk,
+        action=action,
+        ip_address=ip,
+        endpoint=request.path,
+        method=request.method,
+        status_code=response.status_code,
+        response_time=response_time,
+        weight=weight,
+        details={
+            'query_params': dict(request.GET.items()),
+            'content_type': getattr(request, 'content_type', ''),
+        }
+    ))
+
 
 class AuditMixin:
     """
     Reusable mixin for auditing API calls
+
+    Set `audit_policy` on a view to override AUDIT_POLICIES, either for all
+    methods ({'mode': 'errors'}) or per method ({'GET': {'mode': 'sample', 'rate': 0.1}}).
     """
-    
+    audit_policy = None
+
     def dispatch(self, request, *args, **kwargs):
         """Override dispatch to add audit logging"""
         start_time = time.time()
-        
-        # Get client IP
-        x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
-        if x_forwarded_for:
-            ip = x_forwarded_for.split(',')[0]
-        else:
-            ip = request.META.get('REMOTE_ADDR')
-        
+        ip = get_client_ip(request)
+
         # Process the request
         response = super().dispatch(request, *args, **kwargs)
-        
+
         # Log the API call if user is authenticated
-        if hasattr(request, 'user') and request.user.is_authenticated:
-            response_time = time.time() - start_time
-            
-            # Determine action type
-            action = AuditLog.ActionType.API_CALL
-            if request.path.endswith('/login/') and request.method == 'POST':
-                action = AuditLog.ActionType.LOGIN
-            elif request.path.endswith('/logout/') and request.method == 'POST':
-                action = AuditLog.ActionType.LOGOUT
-            
-            # Log the activity
-            AuditLog.log_action(
-                user=request.user,
-                action=action,
-                ip_address=ip,
-                endpoint=request.path,
-                method=request.method,
-                status_code=response.status_code,
-                response_time=response_time,
-                details={
-                    'query_params': dict(request.GET.items()),
-                    'content_type': getattr(request, 'content_type', ''),
-                }
-            )
-        
+        record_api_call(request, response, start_time, ip, resolve_policy(self, request))
+
         return response
 
 def audit_api_call(func):
@@ -56,42 +89,13 @@ def audit_api_call(func):
     @wraps(func)
     def wrapper(self, request, *args, **kwargs):
         start_time = time.time()
-        
-        # Get client IP
-        x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
-        if x_forwarded_for:
-            ip = x_forwarded_for.split(',')[0]
-        else:
-            ip = request.META.get('REMOTE_ADDR')
-        
+        ip = get_client_ip(request)
+
         # Process the request
         response = func(self, request, *args, **kwargs)
-        
+
         # Log the API call if user is authenticated
-        if hasattr(request, 'user') and request.user.is_authenticated:
-            response_time = time.time() - start_time
-            
-            # Determine action type
-            action = AuditLog.ActionType.API_CALL
-            if request.path.endswith('/login/') and request.method == 'POST':
-                action = AuditLog.ActionType.LOGIN
-            elif request.path.endswith('/logout/') and request.method == 'POST':
-                action = AuditLog.ActionType.LOGOUT
-            
-            # Log the activity
-            AuditLog.log_action(
-                user=request.user,
-                action=action,
-                ip_address=ip,
-                endpoint=request.path,
-                method=request.method,
-                status_code=response.status_code,
-                response_time=response_time,
-                details={
-                    'query_params': dict(request.GET.items()),
-                    'content_type': getattr(request, 'content_type', ''),
-                }
-            )
-        
+        record_api_call(request, response, start_time, ip, resolve_policy(self, request))
+
         return response
-    return wrapper 
\ No newline at end of file
+    return wrapper
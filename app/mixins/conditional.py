@@ -0,0 +1,49 @@
+from functools import wraps
+
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+from rest_framework import status
+from rest_framework.response import Response
+
+from app.models import DataVersion
+
+
+def conditional_get(extra=None):
+    """
+    Decorator for per-user GET handlers whose output only changes when the
+    user's DataVersion does.
+
+    The ETag is built from the user's data version, plus extra(request)
+    when given (for output that also depends on e.g. the date). A matching
+    If-None-Match is answered with 304 before the handler runs. Successful
+    responses get ETag and Last-Modified headers. If-Modified-Since is not
+    honoured, since two writes can land in the same second.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, request, *args, **kwargs):
+            version, updated_at = DataVersion.current(request.user.pk)
+            tag = f'{request.user.pk}-{version}'
+            if extra is not None:
+                tag = f'{tag}-{extra(request)}'
+            etag = quote_etag(tag)
+            last_modified = int(updated_at.timestamp()) if updated_at else None
+
+            if_none_match = request.headers.get('If-None-Match', '')
+            candidates = [value.strip() for value in if_none_match.split(',')]
+            if etag in candidates or f'W/{etag}' in candidates:
+                response = Response(status=status.HTTP_304_NOT_MODIFIED)
+            else:
+                response = func(self, request, *args, **kwargs)
+                if response.status_code != status.HTTP_200_OK:
+                    return response
+
+            response['ETag'] = etag
+            if last_modified is not None:
+                response['Last-Modified'] = http_date(last_modified)
+            # Per-user content: shared caches must not reuse it, clients must revalidate
+            patch_cache_control(response, private=True, no_cache=True)
+            patch_vary_headers(response, ('Cookie', 'Authorization'))
+            return response
+        return wrapper
+    return decorator
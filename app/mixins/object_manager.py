@@ -1,3 +1,4 @@
+import math
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated
@@ -16,11 +17,15 @@ class ObjectManager(APIView):
         """
         if hasattr(exc, 'detail'):
             # DRF exceptions
-            return APIResponse.error(
+            response = APIResponse.error(
                 message=str(exc),
                 status_code=exc.status_code if hasattr(exc, 'status_code') else status.HTTP_500_INTERNAL_SERVER_ERROR,
                 errors=exc.detail if hasattr(exc, 'detail') else None
             )
+            if getattr(exc, 'wait', None) is not None:
+                # Throttled and HashingBusy say when to come back
+                response['Retry-After'] = str(math.ceil(exc.wait))
+            return response
         
         # Generic exceptions
         return APIResponse.error(
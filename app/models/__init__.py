@@ -1,4 +1,9 @@
 from app.models.user import *
 from app.models.profile import *
 from app.models.application import *
-from app.models.audit_log import *
\ No newline at end of file
+from app.models.application_summary import *
+from app.models.data_version import *
+from app.models.audit_log import *
+from app.models.audit_rollup import *
+from app.models.job import *
+from app.models.throttle import *
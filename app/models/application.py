@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 from .user import User
 
 class Application(models.Model):
@@ -31,9 +32,51 @@ class Application(models.Model):
         choices=JobType.choices,
         default=JobType.FULL_TIME
     )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    # Fields the per-user summary is derived from
+    SUMMARY_FIELDS = ('user_id', 'status', 'job_type', 'salary', 'interview_date')
 
     def __str__(self):
         return f"{self.position} at {self.company}" 
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance.snapshot_summary_values()
+        return instance
+
+    def summary_values(self):
+        return {field: getattr(self, field) for field in self.SUMMARY_FIELDS}
+
+    def snapshot_summary_values(self):
+        """Remember the summary fields as stored, so signals can compute deltas"""
+        deferred = self.get_deferred_fields()
+        if any(field in deferred for field in self.SUMMARY_FIELDS):
+            self._summary_snapshot = None
+        else:
+            self._summary_snapshot = self.summary_values()
+
+    class Meta:
+        db_table = 'application'
+        indexes = [
+            models.Index(fields=['user', 'status', 'interview_date']),
+            models.Index(fields=['user', 'applied_date', 'id']),
+            models.Index(fields=['user', 'updated_at', 'id']),
+        ]
+
+
+class ApplicationTombstone(models.Model):
+    """Marks a deleted application so delta-sync clients can drop it"""
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='application_tombstones')
+    application_id = models.BigIntegerField()
+    deleted_at = models.DateTimeField(default=timezone.now)
+
     class Meta:
-        db_table = 'application'
\ No newline at end of file
+        db_table = 'application_tombstone'
+        indexes = [
+            models.Index(fields=['user', 'deleted_at', 'id']),
+        ]
+
+    def __str__(self):
+        return f"Application #{self.application_id} deleted at {self.deleted_at}"
@@ -0,0 +1,31 @@
+from django.db import models
+from .user import User
+
+class UserApplicationSummary(models.Model):
+    """Per-user application totals, kept current by the Application signals"""
+    user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='application_summary')
+    total = models.PositiveIntegerField(default=0)
+    status_counts = models.JSONField(default=dict, blank=True)  # {status: count}
+    job_type_counts = models.JSONField(default=dict, blank=True)  # {job_type: count}
+    salary_sums = models.JSONField(default=dict, blank=True)  # {job_type: sum of salaries}
+    salary_counts = models.JSONField(default=dict, blank=True)  # {job_type: applications with a salary}
+    next_interview_date = models.DateField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'user_application_summary'
+
+    def __str__(self):
+        return f"{self.user.email} - {self.total} applications"
+
+    def apply(self, values, sign):
+        """Add (sign=1) or remove (sign=-1) one application's contribution"""
+        def bump(counts, key, amount):
+            counts[key] = counts.get(key, 0) + amount
+
+        self.total += sign
+        bump(self.status_counts, values['status'], sign)
+        bump(self.job_type_counts, values['job_type'], sign)
+        if values['salary'] is not None:
+            bump(self.salary_sums, values['job_type'], sign * values['salary'])
+            bump(self.salary_counts, values['job_type'], sign)
@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 from .user import User
 
 class AuditLog(models.Model):
@@ -12,20 +13,31 @@ class AuditLog(models.Model):
 
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='audit_logs')
     action = models.CharField(max_length=50, choices=ActionType.choices)
-    timestamp = models.DateTimeField(auto_now_add=True)
+    timestamp = models.DateTimeField(default=timezone.now, editable=False)
     ip_address = models.GenericIPAddressField(null=True, blank=True)
     endpoint = models.CharField(max_length=255, blank=True)
     method = models.CharField(max_length=10, blank=True)
     status_code = models.IntegerField(null=True, blank=True)
     response_time = models.FloatField(null=True, blank=True)  # in seconds
     details = models.JSONField(default=dict, blank=True)
-    
+    weight = models.FloatField(default=1.0)  # calls this row stands for when sampled
+
+    # Actions that must never be dropped by the buffered writer
+    SECURITY_ACTIONS = frozenset({
+        ActionType.LOGIN,
+        ActionType.LOGOUT,
+        ActionType.ROLE_CHANGE,
+        ActionType.USER_UPDATE,
+        ActionType.USER_DELETE,
+    })
+
     class Meta:
         db_table = 'audit_log'
         ordering = ['-timestamp']
         indexes = [
             models.Index(fields=['user', 'timestamp']),
             models.Index(fields=['action', 'timestamp']),
+            models.Index(fields=['timestamp', 'id']),
         ]
 
     def __str__(self):
@@ -0,0 +1,50 @@
+from django.db import models
+from .user import User
+from .audit_log import AuditLog
+
+class AuditRollup(models.Model):
+    """Pre-aggregated AuditLog counts per time bucket"""
+    class Granularity(models.TextChoices):
+        HOUR = 'hour', 'Hour'
+        DAY = 'day', 'Day'
+
+    granularity = models.CharField(max_length=4, choices=Granularity.choices)
+    bucket = models.DateTimeField()
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='audit_rollups')
+    action = models.CharField(max_length=50, choices=AuditLog.ActionType.choices)
+    endpoint = models.CharField(max_length=255, blank=True)
+    status_class = models.PositiveSmallIntegerField(default=0)  # 2 for 2xx, 0 when unknown
+    count = models.PositiveIntegerField(default=0)
+    weight = models.FloatField(default=0)  # estimated calls, summing sampled row weights
+    total_response_time = models.FloatField(default=0)  # in seconds
+
+    class Meta:
+        db_table = 'audit_rollup'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['granularity', 'bucket', 'user', 'action', 'endpoint', 'status_class'],
+                name='audit_rollup_unique_bucket',
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['granularity', 'bucket']),
+            models.Index(fields=['granularity', 'action', 'bucket']),
+        ]
+
+    def __str__(self):
+        return f"{self.granularity} {self.bucket} - {self.action} - {self.count}"
+
+
+class AuditRollupCheckpoint(models.Model):
+    """Highest AuditLog id already folded into AuditRollup"""
+    last_log_id = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'audit_rollup_checkpoint'
+
+    @classmethod
+    def current(cls):
+        """Return the id watermark without locking"""
+        checkpoint = cls.objects.filter(pk=1).values_list('last_log_id', flat=True).first()
+        return checkpoint or 0
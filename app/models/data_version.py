@@ -0,0 +1,32 @@
+from django.db import models
+from django.db.models import F
+from django.utils import timezone
+from .user import User
+
+class DataVersion(models.Model):
+    """Per-user counter bumped on every write to the user's applications or profile"""
+    user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='data_version')
+    version = models.PositiveBigIntegerField(default=0)
+    updated_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        db_table = 'user_data_version'
+
+    def __str__(self):
+        return f"{self.user_id} - v{self.version}"
+
+    @classmethod
+    def bump(cls, user_ids):
+        """Increment the version of each user, creating the row on first write"""
+        now = timezone.now()
+        for user_id in sorted(set(user_ids)):
+            updated = cls.objects.filter(user_id=user_id).update(version=F('version') + 1, updated_at=now)
+            if not updated:
+                version, created = cls.objects.get_or_create(user_id=user_id, defaults={'version': 1, 'updated_at': now})
+                if not created:
+                    cls.objects.filter(pk=version.pk).update(version=F('version') + 1, updated_at=now)
+
+    @classmethod
+    def current(cls, user_id):
+        """(version, updated_at) for the user; (0, None) before the first write"""
+        return cls.objects.filter(user_id=user_id).values_list('version', 'updated_at').first() or (0, None)
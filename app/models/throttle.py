@@ -0,0 +1,13 @@
+from django.db import models
+
+class ThrottleBucket(models.Model):
+    """Token bucket state shared by all workers when THROTTLING['BACKEND'] is 'database'"""
+    key = models.CharField(max_length=255, primary_key=True)
+    tokens = models.FloatField()
+    updated_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        db_table = 'throttle_bucket'
+
+    def __str__(self):
+        return f"{self.key} - {self.tokens:.2f}"
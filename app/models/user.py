@@ -29,4 +29,9 @@ class User(AbstractUser):
         return self.role == self.Role.USER
 
     class Meta:
-        db_table = 'user'
\ No newline at end of file
+        db_table = 'user'
+        indexes = [
+            models.Index(fields=['date_joined', 'id']),
+            models.Index(fields=['role', 'date_joined']),
+            models.Index(fields=['is_active', 'date_joined']),
+        ]
\ No newline at end of file
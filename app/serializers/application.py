@@ -1,24 +1,42 @@
 from rest_framework import serializers
 from ..models import Application
+from .sparse import SparseFieldsMixin, isoformat
 from collections import Counter, defaultdict
 from django.db.models import Avg
 
-class ApplicationSerializer(serializers.ModelSerializer):
+class ApplicationSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Application Display Serializer with explicit output structure"""
+    output_fields = {
+        "id": ('id', None),
+        "company": ('company', None),
+        "position": ('position', None),
+        "appliedDate": ('applied_date', isoformat),
+        "status": ('status', None),
+        "interviewDate": ('interview_date', isoformat),
+        "followUpDate": ('follow_up_date', isoformat),
+        "salary": ('salary', None),
+        "jobType": ('job_type', None),
+        "updatedAt": ('updated_at', isoformat),
+    }
 
-    def to_representation(self, instance):
-        response = {}
-        response["id"] = instance.id
-        response["company"] = instance.company
-        response["position"] = instance.position
-        response["appliedDate"] = instance.applied_date.strftime('%Y-%m-%d') if instance.applied_date else None
-        response["status"] = instance.status
-        response["interviewDate"] = instance.interview_date.strftime('%Y-%m-%d') if instance.interview_date else None
-        response["followUpDate"] = instance.follow_up_date.strftime('%Y-%m-%d') if instance.follow_up_date else None
-        response["salary"] = instance.salary
-        response["jobType"] = instance.job_type
-
-        return response
+# Columns read by serialize_application_values(); pass to QuerySet.values()
+APPLICATION_VALUE_FIELDS = tuple(ApplicationSerializer.columns())
+
+def serialize_application_values(rows, fields=None):
+    """
+    Same output as ApplicationSerializer, built from QuerySet.values() rows
+    without creating model instances. For list responses. The rows need
+    the ApplicationSerializer.columns(fields) columns.
+    """
+    output = [(key, *ApplicationSerializer.output_fields[key]) for key in fields or ApplicationSerializer.output_fields]
+    return [
+        {
+            key: value if formatter is None or value is None else formatter(value)
+            for key, source, formatter in output
+            for value in (row[source],)
+        }
+        for row in rows
+    ]
 
 class ApplicationCreateUpdateSerializer(serializers.ModelSerializer):
     """Application Write Serializer for creating and updating applications"""
@@ -1,20 +1,18 @@
 from rest_framework import serializers
 from ..models import Profile
+from .sparse import SparseFieldsMixin
 
-class ProfileSerializer(serializers.ModelSerializer):
+class ProfileSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Profile Display Serializer with explicit output structure"""
-
-    def to_representation(self, instance):
-        response = {}
-        response["id"] = instance.id
-        response["username"] = instance.user.username if instance.user else None
-        response["email"] = instance.user.email if instance.user else None
-        response["first_name"] = instance.first_name
-        response["middle_name"] = instance.middle_name
-        response["last_name"] = instance.last_name
-        response["birth_date"] = instance.birth_date
-        
-        return response 
+    output_fields = {
+        "id": ('id', None),
+        "username": ('user__username', None),
+        "email": ('user__email', None),
+        "first_name": ('first_name', None),
+        "middle_name": ('middle_name', None),
+        "last_name": ('last_name', None),
+        "birth_date": ('birth_date', None),
+    }
     
 class ProfileCreateUpdateSerializer(serializers.ModelSerializer):
     class Meta:
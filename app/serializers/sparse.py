@@ -0,0 +1,51 @@
+def isoformat(value):
+    return value.isoformat()
+
+
+def resolve(instance, path):
+    """Follow a model field path such as 'user__email', stopping at None"""
+    for attr in path.split('__'):
+        if instance is None:
+            return None
+        instance = getattr(instance, attr)
+    return instance
+
+
+class SparseFieldsMixin:
+    """
+    Display serializer rendering only the output keys passed as `fields`.
+
+    Subclasses describe their output in `output_fields` as
+    {output key: (model field path, formatter or None)}; only the paths of
+    the selected keys are read, so instances loaded with .only(*columns(fields))
+    render without extra queries.
+    """
+    output_fields = {}
+
+    def __init__(self, *args, fields=None, **kwargs):
+        self.selected_fields = fields
+        super().__init__(*args, **kwargs)
+
+    @classmethod
+    def columns(cls, fields=None):
+        """Model field paths needed to render fields (all output keys by default)"""
+        return [cls.output_fields[key][0] for key in fields or cls.output_fields]
+
+    @classmethod
+    def project(cls, queryset, fields=None):
+        """Load only the columns (and related rows) that fields need"""
+        if fields is None:
+            return queryset
+        columns = cls.columns(fields)
+        related = {column.rsplit('__', 1)[0] for column in columns if '__' in column}
+        if related:
+            queryset = queryset.select_related(*related)
+        return queryset.only(*columns, *related)
+
+    def to_representation(self, instance):
+        response = {}
+        for key in self.selected_fields or self.output_fields:
+            source, formatter = self.output_fields[key]
+            value = resolve(instance, source)
+            response[key] = formatter(value) if formatter and value is not None else value
+        return response
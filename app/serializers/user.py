@@ -1,18 +1,17 @@
 from rest_framework import serializers
 from ..models import User
+from .sparse import SparseFieldsMixin
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """User Display Serializer with explicit output structure"""
-
-    def to_representation(self, instance):
-        response = {}
-        response["id"] = instance.id
-        response["username"] = instance.username
-        response["email"] = instance.email
-        response["role"] = instance.role
-        response["created_at"] = instance.date_joined
-        response["updated_at"] = instance.last_login
-        return response
+    output_fields = {
+        "id": ('id', None),
+        "username": ('username', None),
+        "email": ('email', None),
+        "role": ('role', None),
+        "created_at": ('date_joined', None),
+        "updated_at": ('last_login', None),
+    }
 
 class UserCreateSerializer(serializers.ModelSerializer):
     password = serializers.CharField(write_only=True)
@@ -0,0 +1,3 @@
+from app.signals.auth import *
+from app.signals.application import *
+from app.signals.profile import *
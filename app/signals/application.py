@@ -0,0 +1,51 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from app.models import Application, User
+from app.utils.application_summary import apply_change, mark_changed, mark_stale
+from app.utils.changes import record_tombstone
+
+__all__ = ['update_summary_on_save', 'update_summary_on_delete', 'record_tombstone_on_delete']
+
+
+@receiver(post_save, sender=Application)
+def update_summary_on_save(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    """Fold a saved application into its user's summary and bump their data version"""
+    if raw:
+        return
+    if update_fields is not None and not {'user', *Application.SUMMARY_FIELDS} & set(update_fields):
+        mark_changed([instance.user_id])
+        return
+
+    old = None if created else getattr(instance, '_summary_snapshot', None)
+    if not created and old is None:
+        # Stored values unknown (built by hand or loaded with deferred fields)
+        mark_stale([instance.user_id])
+    else:
+        apply_change(old, instance.summary_values())
+        if old and old['user_id'] != instance.user_id:
+            # Gone from the previous owner's point of view
+            record_tombstone(old['user_id'], instance.pk)
+    instance.snapshot_summary_values()
+
+
+@receiver(post_delete, sender=Application)
+def update_summary_on_delete(sender, instance, origin=None, **kwargs):
+    """Remove a deleted application from its user's summary"""
+    if isinstance(origin, User) or getattr(origin, 'model', None) is User:
+        # The summary is going with the user
+        return
+
+    old = getattr(instance, '_summary_snapshot', None)
+    if old is None:
+        mark_stale([instance.user_id])
+    else:
+        apply_change(old, None)
+
+
+@receiver(post_delete, sender=Application)
+def record_tombstone_on_delete(sender, instance, origin=None, **kwargs):
+    """Leave a tombstone so delta-sync clients drop the application"""
+    if isinstance(origin, User) or getattr(origin, 'model', None) is User:
+        return
+    record_tombstone(instance.user_id, instance.pk)
@@ -0,0 +1,22 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from app.models import User
+from app.utils.authentication import invalidate_cached_user
+
+__all__ = ['invalidate_user_on_save', 'invalidate_user_on_delete']
+
+
+@receiver(post_save, sender=User)
+def invalidate_user_on_save(sender, instance, **kwargs):
+    """
+    Role, is_active and password changes must reach the next request. Only
+    this process's cache is cleared unless AUTH_CACHE['USER_CACHE_ALIAS'] is
+    shared; other processes catch up within USER_TTL.
+    """
+    invalidate_cached_user(instance.pk)
+
+
+@receiver(post_delete, sender=User)
+def invalidate_user_on_delete(sender, instance, **kwargs):
+    invalidate_cached_user(instance.pk)
@@ -0,0 +1,28 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from app.models import DataVersion, Profile, User
+
+__all__ = ['bump_version_on_profile_save', 'bump_version_on_profile_delete', 'bump_version_on_user_save']
+
+
+@receiver(post_save, sender=Profile)
+def bump_version_on_profile_save(sender, instance, raw=False, **kwargs):
+    if not raw:
+        DataVersion.bump([instance.user_id])
+
+
+@receiver(post_delete, sender=Profile)
+def bump_version_on_profile_delete(sender, instance, origin=None, **kwargs):
+    if isinstance(origin, User) or getattr(origin, 'model', None) is User:
+        # The version row is going with the user
+        return
+    DataVersion.bump([instance.user_id])
+
+
+@receiver(post_save, sender=User)
+def bump_version_on_user_save(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    """The profile response includes the username and email"""
+    if raw or created or (update_fields is not None and set(update_fields) <= {'last_login'}):
+        return
+    DataVersion.bump([instance.pk])
@@ -1,3 +1,31 @@
-from django.test import TestCase
+from django.conf import settings
+from django.test import TestCase, override_settings
 
-# Create your tests here.
+from app.models import User
+from app.utils import throttling
+
+
+@override_settings(AUDIT_LOG_BUFFER={**settings.AUDIT_LOG_BUFFER, 'ENABLED': False})
+class APITestCase(TestCase):
+    """TestCase with a signed-in user; audit logs are written synchronously"""
+
+    password = 'test-pass-123!'
+
+    def setUp(self):
+        # Buckets live in the process, so they would carry over between tests
+        throttling._backend = None
+        self.user = self.create_user('user@example.com')
+        self.login(self.user)
+
+    def create_user(self, email, **kwargs):
+        return User.objects.create_user(
+            username=email.split('@')[0], email=email, password=self.password, **kwargs
+        )
+
+    def login(self, user, client=None):
+        client = client or self.client
+        response = client.post(
+            '/api/login/', {'email': user.email, 'password': self.password}, content_type='application/json'
+        )
+        self.assertEqual(response.status_code, 200, response.content)
+        return client
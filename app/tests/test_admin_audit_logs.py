@@ -0,0 +1,49 @@
+from django.utils import timezone
+
+from app.models import AuditLog
+from app.tests.base import APITestCase
+
+
+class AdminAuditLogCursorTests(APITestCase):
+    url = '/api/admin/audit-logs/'
+
+    def setUp(self):
+        super().setUp()
+        self.admin = self.create_user('admin@example.com', role='ADMIN')
+        self.login(self.admin)
+        # Shared timestamps, so pages must break ties on id
+        timestamps = [timezone.now()] * 4 + [timezone.now().replace(microsecond=0)] * 3
+        AuditLog.objects.bulk_create([
+            AuditLog(user=self.user, action=AuditLog.ActionType.API_CALL, timestamp=timestamp)
+            for timestamp in timestamps
+        ])
+        self.expected = list(
+            AuditLog.objects.filter(user=self.user).order_by('-timestamp', '-id').values_list('id', flat=True)
+        )
+
+    def get_page(self, **params):
+        response = self.client.get(self.url, {'user_id': self.user.id, 'page_size': 3, **params})
+        self.assertEqual(response.status_code, 200, response.content)
+        data = response.json()['data']
+        return [log['id'] for log in data['logs']], data['pagination']
+
+    def test_cursor_pages_cover_every_row_once(self):
+        ids, pagination = self.get_page(pagination='cursor')
+        self.assertIsNone(pagination['prev_cursor'])
+        while pagination['next_cursor']:
+            page, pagination = self.get_page(cursor=pagination['next_cursor'])
+            ids += page
+        self.assertEqual(ids, self.expected)
+
+    def test_prev_cursor_returns_the_previous_page(self):
+        first, pagination = self.get_page(pagination='cursor')
+        second, pagination = self.get_page(cursor=pagination['next_cursor'])
+        self.assertEqual(second, self.expected[3:6])
+
+        previous, pagination = self.get_page(cursor=pagination['prev_cursor'])
+        self.assertEqual(previous, first)
+        self.assertIsNone(pagination['prev_cursor'])
+
+    def test_invalid_cursor(self):
+        response = self.client.get(self.url, {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,88 @@
+from app.models import Application
+from app.tests.base import APITestCase
+
+
+def item(company, **kwargs):
+    return {'company': company, 'position': 'Engineer', 'applied_date': '2024-01-01', **kwargs}
+
+
+class ApplicationBulkTests(APITestCase):
+    url = '/api/applications/bulk/'
+
+    def send(self, method, data):
+        return getattr(self.client, method)(self.url, data, content_type='application/json')
+
+    def test_create(self):
+        response = self.send('post', {'items': [item('Acme'), item('Globex')]})
+
+        self.assertEqual(response.status_code, 201, response.content)
+        results = response.json()['data']['results']
+        self.assertEqual([(r['index'], r['result'], r['company']) for r in results],
+                         [(0, 'created', 'Acme'), (1, 'created', 'Globex')])
+        self.assertEqual(Application.objects.filter(user=self.user).count(), 2)
+
+    def test_create_with_an_invalid_item_writes_nothing(self):
+        response = self.send('post', {'items': [item('Acme'), item('Globex', applied_date='never')]})
+
+        self.assertEqual(response.status_code, 400)
+        errors = response.json()['details']['items']
+        self.assertEqual([error['index'] for error in errors], [1])
+        self.assertIn('applied_date', errors[0]['errors'])
+        self.assertFalse(Application.objects.exists())
+
+    def test_update_with_an_unknown_id_writes_nothing(self):
+        application = Application.objects.create(user=self.user, **item('Acme'))
+        other = self.create_user('other@example.com')
+        foreign = Application.objects.create(user=other, **item('Globex'))
+
+        response = self.send('patch', {'items': [
+            {'id': application.id, 'company': 'Renamed'},
+            {'id': foreign.id, 'company': 'Stolen'},
+        ]})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual([error['index'] for error in response.json()['details']['items']], [1])
+        application.refresh_from_db()
+        foreign.refresh_from_db()
+        self.assertEqual((application.company, foreign.company), ('Acme', 'Globex'))
+
+    def test_update(self):
+        first = Application.objects.create(user=self.user, **item('Acme'))
+        second = Application.objects.create(user=self.user, **item('Globex'))
+
+        response = self.send('patch', {'items': [
+            {'id': first.id, 'status': Application.Status.REJECTED},
+            {'id': second.id, 'company': 'Initech'},
+        ]})
+
+        self.assertEqual(response.status_code, 200, response.content)
+        first.refresh_from_db()
+        second.refresh_from_db()
+        self.assertEqual(first.status, Application.Status.REJECTED)
+        self.assertEqual(second.company, 'Initech')
+
+    def test_delete_reports_each_id(self):
+        application = Application.objects.create(user=self.user, **item('Acme'))
+        foreign = Application.objects.create(user=self.create_user('other@example.com'), **item('Globex'))
+
+        response = self.send('delete', {'ids': [application.id, foreign.id]})
+
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual([r['result'] for r in response.json()['data']['results']], ['deleted', 'not_found'])
+        self.assertEqual(list(Application.objects.values_list('id', flat=True)), [foreign.id])
+
+    def test_booleans_are_not_ids(self):
+        application = Application.objects.create(user=self.user, **item('Acme'))
+
+        response = self.send('patch', {'items': [{'id': True, 'company': 'Renamed'}]})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.send('delete', {'ids': [True]}).status_code, 400)
+
+        application.refresh_from_db()
+        self.assertEqual(application.company, 'Acme')
+
+    def test_item_limit(self):
+        with self.settings(APPLICATION_BULK_MAX_ITEMS=2):
+            response = self.send('post', {'items': [item('Acme')] * 3})
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Application.objects.exists())
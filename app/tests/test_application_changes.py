@@ -0,0 +1,97 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from app.jobs.runner import claim_job, run_job
+from app.models import Application, ApplicationTombstone, Job, User
+from app.tests.base import APITestCase
+from app.utils.changes import DELETE, encode_cursor
+
+
+@override_settings(APPLICATION_CHANGES={**settings.APPLICATION_CHANGES, 'SETTLE_SECONDS': 0})
+class ApplicationChangesTests(APITestCase):
+    url = '/api/applications/changes/'
+
+    def setUp(self):
+        super().setUp()
+        self.applications = [
+            Application.objects.create(user=self.user, company=f'Company {i}', position='Engineer',
+                                       applied_date='2024-01-01')
+            for i in range(3)
+        ]
+
+    def sync(self, since=None, **params):
+        if since:
+            params['since'] = since
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()['data']
+
+    @staticmethod
+    def summarize(data):
+        return [
+            (change['type'], change['application']['id'] if change['type'] == 'upsert' else change['id'])
+            for change in data['changes']
+        ]
+
+    def test_first_sync_returns_everything(self):
+        data = self.sync()
+        self.assertEqual(self.summarize(data), [('upsert', a.id) for a in self.applications])
+        self.assertFalse(data['has_more'])
+
+        # Nothing changed since
+        again = self.sync(data['cursor'])
+        self.assertEqual(again['changes'], [])
+        self.assertEqual(again['cursor'], data['cursor'])
+
+    def test_updates_and_deletes_since_cursor(self):
+        cursor = self.sync()['cursor']
+        first, second, _ = self.applications
+        self.client.put(f'/api/applications/{first.id}/', {
+            'company': 'Renamed', 'position': 'Engineer', 'applied_date': '2024-01-01',
+        }, content_type='application/json')
+        self.client.delete(f'/api/applications/{second.id}/')
+
+        data = self.sync(cursor)
+        self.assertEqual(self.summarize(data), [('upsert', first.id), ('delete', second.id)])
+        self.assertEqual(data['changes'][0]['application']['company'], 'Renamed')
+
+    def test_pages_with_limit(self):
+        data = self.sync(limit=2)
+        self.assertTrue(data['has_more'])
+        rest = self.sync(data['cursor'], limit=2)
+        self.assertFalse(rest['has_more'])
+        self.assertEqual(self.summarize(data) + self.summarize(rest),
+                         [('upsert', a.id) for a in self.applications])
+
+    def test_bulk_delete_writes_tombstones_in_one_insert(self):
+        cursor = self.sync()['cursor']
+        ids = [a.id for a in self.applications]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.delete('/api/applications/bulk/', {'ids': ids}, content_type='application/json')
+        self.assertEqual(response.status_code, 200, response.content)
+        inserts = [q['sql'] for q in queries if q['sql'].startswith('INSERT INTO "application_tombstone"')]
+        self.assertEqual(len(inserts), 1)
+
+        self.assertEqual(sorted(self.summarize(self.sync(cursor))), [('delete', pk) for pk in ids])
+
+    def test_deleting_a_user_writes_no_tombstones(self):
+        Job.enqueue('delete_user', payload={'user_id': self.user.id})
+
+        with CaptureQueriesContext(connection) as queries:
+            run_job(claim_job('test'))
+        self.assertFalse(User.objects.filter(pk=self.user.pk).exists())
+        self.assertFalse([q for q in queries if q['sql'].startswith('INSERT INTO "application_tombstone"')])
+        self.assertFalse(ApplicationTombstone.objects.exists())
+
+    def test_invalid_and_expired_cursors(self):
+        self.assertEqual(self.client.get(self.url, {'since': 'not-a-cursor'}).status_code, 400)
+
+        retention = settings.APPLICATION_CHANGES['TOMBSTONE_RETENTION_DAYS']
+        expired = encode_cursor(timezone.now() - timedelta(days=retention + 1), DELETE, 1)
+        self.assertEqual(self.client.get(self.url, {'since': expired}).status_code, 410)
@@ -0,0 +1,37 @@
+import io
+
+from django.conf import settings
+from django.test import override_settings
+
+from app.models import Application
+from app.tests.base import APITestCase
+from app.utils.imports import import_applications, read_rows
+
+
+def csv_rows(count):
+    lines = ['company,position,applied_date'] + [f'Company {i},Engineer,2024-01-01' for i in range(count)]
+    return read_rows(io.BytesIO('\n'.join(lines).encode()), 'csv')
+
+
+@override_settings(APPLICATION_IMPORT={**settings.APPLICATION_IMPORT, 'CHUNK_SIZE': 2})
+class ImportResumeTests(APITestCase):
+    def test_chunk_and_progress_commit_together(self):
+        saved = []
+
+        def save_progress(totals):
+            if saved:
+                raise RuntimeError('worker died')
+            saved.append(dict(totals))
+
+        with self.assertRaises(RuntimeError):
+            import_applications(self.user, csv_rows(5), on_chunk=save_progress)
+        # The failing chunk rolled back along with its progress
+        self.assertEqual(Application.objects.count(), 2)
+        self.assertEqual(saved, [{'processed': 2, 'created': 2, 'error_count': 0, 'errors': []}])
+
+        totals = import_applications(self.user, csv_rows(5), resume=saved[-1])
+        self.assertEqual(totals['processed'], 5)
+        self.assertEqual(
+            sorted(Application.objects.values_list('company', flat=True)),
+            [f'Company {i}' for i in range(5)],
+        )
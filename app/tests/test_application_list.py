@@ -0,0 +1,66 @@
+from datetime import date, timedelta
+
+from app.models import Application
+from app.tests.base import APITestCase
+
+
+class ApplicationCursorTests(APITestCase):
+    url = '/api/applications/'
+
+    def setUp(self):
+        super().setUp()
+        # Two applications per day, so pages must break ties on id
+        start = date(2024, 1, 1)
+        Application.objects.bulk_create([
+            Application(user=self.user, company=f'Company {i}', position='Engineer',
+                        applied_date=start + timedelta(days=i // 2))
+            for i in range(7)
+        ])
+        other = self.create_user('other@example.com')
+        Application.objects.create(user=other, company='Other', position='Engineer', applied_date=start)
+        self.expected = list(
+            Application.objects.filter(user=self.user).order_by('-applied_date', '-id').values_list('id', flat=True)
+        )
+
+    def get_page(self, **params):
+        response = self.client.get(self.url, {'page_size': 3, **params})
+        self.assertEqual(response.status_code, 200, response.content)
+        data = response.json()['data']
+        return [application['id'] for application in data['results']], data['pagination']
+
+    def test_cursor_pages_cover_every_row_once(self):
+        ids, pagination = self.get_page(pagination='cursor')
+        self.assertIsNone(pagination['prev_cursor'])
+        while pagination['next_cursor']:
+            page, pagination = self.get_page(cursor=pagination['next_cursor'])
+            ids += page
+        self.assertEqual(ids, self.expected)
+
+    def test_prev_cursor_returns_the_previous_page(self):
+        first, pagination = self.get_page(pagination='cursor')
+        second, pagination = self.get_page(cursor=pagination['next_cursor'])
+        self.assertEqual(second, self.expected[3:6])
+
+        previous, pagination = self.get_page(cursor=pagination['prev_cursor'])
+        self.assertEqual(previous, first)
+
+    def test_cursor_respects_date_filters(self):
+        ids, pagination = self.get_page(pagination='cursor', applied_date_after='2024-01-02')
+        page, pagination = self.get_page(cursor=pagination['next_cursor'], applied_date_after='2024-01-02')
+        self.assertEqual(ids + page, self.expected[:5])
+        self.assertIsNone(pagination['next_cursor'])
+
+    def test_invalid_cursor(self):
+        response = self.client.get(self.url, {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_pages_without_total(self):
+        ids, pagination = self.get_page(include_total='false', page=3)
+        self.assertEqual(ids, self.expected[6:])
+        self.assertEqual(pagination, {'page': 3, 'page_size': 3, 'has_next': False})
+
+    def test_pages_without_total_reject_bad_page(self):
+        for page in ('-1', '0', 'abc'):
+            response = self.client.get(self.url, {'include_total': 'false', 'page': page})
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(response.json()['error'], "'page' must be a positive integer")
@@ -0,0 +1,37 @@
+from django.conf import settings
+from django.test import override_settings
+
+from app.tests.base import APITestCase
+from app.utils.authentication import user_cache
+
+
+class CachedUserTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        user_cache.clear()
+        # Puts the user in the authentication cache
+        self.assertEqual(self.client.get('/api/applications/').status_code, 200)
+
+    def test_deactivated_user_is_rejected_on_the_next_request(self):
+        self.user.is_active = False
+        self.user.save()
+
+        self.assertEqual(self.client.get('/api/applications/').status_code, 401)
+
+    def test_demoted_admin_loses_access_on_the_next_request(self):
+        admin = self.create_user('admin@example.com', role='ADMIN')
+        self.login(admin)
+        self.assertEqual(self.client.get('/api/admin/users/').status_code, 200)
+
+        admin.role = 'USER'
+        admin.save()
+
+        self.assertEqual(self.client.get('/api/admin/users/').status_code, 403)
+
+    @override_settings(AUTH_CACHE={**settings.AUTH_CACHE, 'USER_CACHE_ALIAS': 'default'})
+    def test_deactivation_with_a_shared_cache(self):
+        self.assertEqual(self.client.get('/api/applications/').status_code, 200)
+        self.user.is_active = False
+        self.user.save()
+
+        self.assertEqual(self.client.get('/api/applications/').status_code, 401)
@@ -0,0 +1,81 @@
+from datetime import date, timedelta
+
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+from app.models import Application, Profile
+from app.tests.base import APITestCase
+
+
+# Keeps audit inserts out of the query counts
+@override_settings(AUDIT_POLICIES=[{'endpoint': '/api/', 'mode': 'never'}])
+class SparseFieldsTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.application = Application.objects.create(
+            user=self.user, company='Acme', position='Engineer', applied_date=date(2024, 1, 1), salary=100,
+        )
+
+    def test_keys_follow_the_serializer_order(self):
+        response = self.client.get('/api/applications/', {'fields': 'status, company,id'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(response.json()['data']['results'][0]), ['id', 'company', 'status'])
+
+    def test_unknown_and_empty_field_lists(self):
+        for url in ('/api/applications/', f'/api/applications/{self.application.id}/', '/api/profile/'):
+            response = self.client.get(url, {'fields': 'id,nope'})
+            self.assertEqual(response.status_code, 400, url)
+            self.assertIn('Unknown field(s): nope', response.json()['error'])
+
+            for empty in ('', ' , '):
+                response = self.client.get(url, {'fields': empty})
+                self.assertEqual(response.status_code, 400, url)
+                self.assertEqual(response.json()['error'], "'fields' must name at least one field")
+
+    def test_detail_reads_only_the_requested_columns(self):
+        url = f'/api/applications/{self.application.id}/'
+        self.client.get(url)
+
+        # DataVersion for the ETag and the application
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, {'fields': 'company,salary'})
+        self.assertEqual(len(queries), 2, '\n'.join(q['sql'] for q in queries))
+        self.assertNotIn('"position"', queries[-1]['sql'])
+        self.assertEqual(response.json()['data'], {'company': 'Acme', 'salary': 100})
+
+    def test_profile_reads_user_columns_in_the_same_query(self):
+        Profile.objects.create(user=self.user, first_name='Ada')
+        self.client.get('/api/profile/')
+
+        # DataVersion for the ETag and the profile joined to its user
+        with self.assertNumQueries(2):
+            response = self.client.get('/api/profile/', {'fields': 'email,first_name'})
+        self.assertEqual(response.json()['data'], {'email': self.user.email, 'first_name': 'Ada'})
+
+    def test_cursor_paging_without_id_or_applied_date(self):
+        Application.objects.bulk_create([
+            Application(user=self.user, company=f'Company {i}', position='Engineer',
+                        applied_date=date(2024, 1, 2) + timedelta(days=i // 2))
+            for i in range(4)
+        ])
+        params = {'fields': 'company', 'page_size': 2}
+        data = self.client.get('/api/applications/', {**params, 'pagination': 'cursor'}).json()['data']
+        companies = [row['company'] for row in data['results']]
+        while data['pagination']['next_cursor']:
+            response = self.client.get('/api/applications/', {**params, 'cursor': data['pagination']['next_cursor']})
+            self.assertEqual(response.status_code, 200)
+            data = response.json()['data']
+            self.assertEqual([list(row) for row in data['results']], [['company']] * len(data['results']))
+            companies += [row['company'] for row in data['results']]
+
+        expected = Application.objects.order_by('-applied_date', '-id').values_list('company', flat=True)
+        self.assertEqual(companies, list(expected))
+
+    def test_login_returns_the_requested_user_fields(self):
+        response = self.client.post(
+            '/api/login/?fields=email', {'email': self.user.email, 'password': self.password},
+            content_type='application/json',
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['data']['user'], {'email': self.user.email})
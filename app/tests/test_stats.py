@@ -0,0 +1,66 @@
+from datetime import date, timedelta
+
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+from app.models import Application
+from app.tests.base import APITestCase
+from app.utils.application_summary import mark_stale
+
+
+class ApplicationStatsTests(APITestCase):
+    url = '/api/applications/stats/'
+
+    def create_applications(self, count, **kwargs):
+        Application.objects.bulk_create([
+            Application(user=self.user, company=f'Company {i}', position='Engineer',
+                        applied_date=date.today(), **kwargs)
+            for i in range(count)
+        ])
+        # bulk_create sends no signals, so mark the summary stale as the bulk endpoint does
+        mark_stale([self.user.pk])
+
+    def test_counts_and_upcoming_interviews(self):
+        self.create_applications(3)
+        self.create_applications(2, status=Application.Status.REJECTED)
+        Application.objects.create(
+            user=self.user, company='Acme', position='Engineer', applied_date=date.today(),
+            status=Application.Status.INTERVIEW, interview_date=date.today() + timedelta(days=3),
+        )
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()['data']
+        self.assertEqual(data['total_applications'], 6)
+        self.assertEqual(data['interviews_scheduled'], 1)
+        self.assertEqual(data['rejected_applications'], 2)
+        self.assertEqual(data['accepted_applications'], 0)
+        self.assertEqual([i['company'] for i in data['upcoming_interviews']], ['Acme'])
+
+    # Audit every call, so the budget does not depend on the sampling dice
+    @override_settings(AUDIT_POLICIES=[{'endpoint': '/api/applications/stats/', 'mode': 'always'}])
+    def test_query_budget_does_not_grow_with_applications(self):
+        self.create_applications(2, status=Application.Status.INTERVIEW,
+                                 interview_date=date.today() + timedelta(days=1))
+        # Loads the user and summary caches the budget below assumes
+        self.client.get(self.url)
+
+        self.assertStatsQueries()
+
+        self.create_applications(50, status=Application.Status.INTERVIEW,
+                                 interview_date=date.today() + timedelta(days=2))
+        self.client.get(self.url)
+        response = self.assertStatsQueries()
+        self.assertEqual(response.json()['data']['interviews_scheduled'], 52)
+        self.assertEqual(len(response.json()['data']['upcoming_interviews']), 10)
+
+    def assertStatsQueries(self):
+        # DataVersion for the ETag, the summary, upcoming interviews and the audit log insert
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(queries), 4, '\n'.join(q['sql'] for q in queries))
+        self.assertEqual(sum(q['sql'].startswith('INSERT INTO "audit_log"') for q in queries), 1)
+        return response
@@ -0,0 +1,90 @@
+from django.conf import settings
+from django.test import override_settings
+
+from app.models import AuditLog
+from app.tests.base import APITestCase
+from app.utils import throttling
+
+
+def rates(**scopes):
+    return override_settings(REST_FRAMEWORK={
+        **settings.REST_FRAMEWORK,
+        'DEFAULT_THROTTLE_RATES': {**settings.REST_FRAMEWORK['DEFAULT_THROTTLE_RATES'], **scopes},
+    })
+
+
+@rates(login='3/min')
+class LoginThrottleTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        # Signing in took a token from the same bucket
+        throttling._backend = None
+
+    def attempt(self, client, **headers):
+        return client.post('/api/login/', {'email': self.user.email, 'password': 'wrong'},
+                           content_type='application/json', **headers)
+
+    def test_429_with_retry_after(self):
+        client = self.client_class()
+        for _ in range(3):
+            self.assertEqual(self.attempt(client).status_code, 401)
+
+        response = self.attempt(client)
+        self.assertEqual(response.status_code, 429)
+        self.assertGreaterEqual(int(response['Retry-After']), 1)
+
+    def test_client_supplied_forwarded_for_is_ignored(self):
+        client = self.client_class()
+        statuses = [
+            self.attempt(client, HTTP_X_FORWARDED_FOR=f'203.0.113.{i}').status_code
+            for i in range(4)
+        ]
+        self.assertEqual(statuses, [401, 401, 401, 429])
+
+    @override_settings(TRUSTED_PROXIES=1)
+    def test_trusted_proxy_hop_is_the_key(self):
+        client = self.client_class()
+        # The proxy appends the address it saw; entries before it are the client's
+        statuses = [
+            self.attempt(client, HTTP_X_FORWARDED_FOR=f'203.0.113.{i}, 198.51.100.7').status_code
+            for i in range(4)
+        ]
+        self.assertEqual(statuses, [401, 401, 401, 429])
+
+        # Another client behind the same proxy has its own bucket
+        response = self.attempt(client, HTTP_X_FORWARDED_FOR='198.51.100.8')
+        self.assertEqual(response.status_code, 401)
+
+
+@rates(application_write='2/min')
+class ApplicationWriteThrottleTests(APITestCase):
+    def create(self, client):
+        return client.post('/api/applications/', {
+            'company': 'Acme', 'position': 'Engineer', 'applied_date': '2024-01-01',
+        }, content_type='application/json')
+
+    def test_writes_are_throttled_per_user(self):
+        self.assertEqual(self.create(self.client).status_code, 201)
+        self.assertEqual(self.create(self.client).status_code, 201)
+        response = self.create(self.client)
+        self.assertEqual(response.status_code, 429)
+        self.assertIn('Retry-After', response)
+
+        # Reads are not throttled, and other users have their own bucket
+        self.assertEqual(self.client.get('/api/applications/').status_code, 200)
+        other = self.login(self.create_user('other@example.com'), self.client_class())
+        self.assertEqual(self.create(other).status_code, 201)
+
+
+class ClientAddressTests(APITestCase):
+    def last_audit_ip(self, **headers):
+        self.client.get('/api/profile/', **headers)
+        return AuditLog.objects.filter(user=self.user).latest('id').ip_address
+
+    def test_audit_logs_ignore_client_supplied_forwarded_for(self):
+        self.assertEqual(self.last_audit_ip(HTTP_X_FORWARDED_FOR='203.0.113.9', REMOTE_ADDR='10.0.0.1'), '10.0.0.1')
+
+    @override_settings(TRUSTED_PROXIES=1)
+    def test_audit_logs_use_the_trusted_proxy_hop(self):
+        ip = self.last_audit_ip(HTTP_X_FORWARDED_FOR='203.0.113.9, 198.51.100.7', REMOTE_ADDR='10.0.0.1')
+        self.assertEqual(ip, '198.51.100.7')
@@ -1,13 +1,14 @@
 from django.urls import path
 from .views.auth import LoginAPIView, RegisterAPIView, LogoutAPIView, CookieTokenRefreshView, AuthCheckAPIView
 from .views.profile import ProfileAPIView
-from .views.application import ApplicationAPIView
+from .views.application import ApplicationAPIView, ApplicationBulkAPIView, ApplicationChangesAPIView, ApplicationImportAPIView
 from .views.application import ApplicationStatsAPIView
 from .views.application import ApplicationAnalyticsAPIView
 from .views.admin import (
     admin_users, admin_delete_user,
-    admin_audit_logs, admin_dashboard,
-    admin_user_profile, admin_user_applications, admin_application_detail
+    admin_audit_logs, admin_audit_logs_export, admin_dashboard, admin_latency_analytics,
+    admin_user_profile, admin_user_applications, admin_application_detail, admin_application_search,
+    admin_job_detail,
 )
 
 # The API URLs
@@ -24,6 +25,10 @@ urlpatterns = [
     
     # Application URLs
     path('applications/', ApplicationAPIView.as_view(), name='applications'),
+    path('applications/changes/', ApplicationChangesAPIView.as_view(), name='applications-changes'),
+    path('applications/bulk/', ApplicationBulkAPIView.as_view(), name='applications-bulk'),
+    path('applications/import/', ApplicationImportAPIView.as_view(), name='applications-import'),
+    path('applications/import/<int:job_id>/', ApplicationImportAPIView.as_view(), name='applications-import-status'),
     path('applications/<int:application_id>/', ApplicationAPIView.as_view(), name='application-detail'),
     path('applications/stats/', ApplicationStatsAPIView.as_view(), name='application-stats'),
     path('applications/analytics/', ApplicationAnalyticsAPIView.as_view(), name='application-analytics'),
@@ -32,8 +37,12 @@ urlpatterns = [
     path('admin/users/', admin_users, name='admin-users'),
     path('admin/users/<int:user_id>/delete/', admin_delete_user, name='admin-delete-user'),
     path('admin/audit-logs/', admin_audit_logs, name='admin-audit-logs'),
+    path('admin/audit-logs/export/', admin_audit_logs_export, name='admin-audit-logs-export'),
     path('admin/dashboard/', admin_dashboard, name='admin-dashboard'),
+    path('admin/analytics/latency/', admin_latency_analytics, name='admin-latency-analytics'),
     path('admin/users/<int:user_id>/profile/', admin_user_profile, name='admin-user-profile'),
     path('admin/users/<int:user_id>/applications/', admin_user_applications, name='admin-user-applications'),
+    path('admin/applications/search/', admin_application_search, name='admin-application-search'),
     path('admin/applications/<int:application_id>/', admin_application_detail, name='admin-application-detail'),
+    path('admin/jobs/<int:job_id>/', admin_job_detail, name='admin-job-detail'),
 ] 
\ No newline at end of file
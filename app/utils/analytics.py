@@ -0,0 +1,42 @@
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncMonth
+
+# Grouping dimensions: a model field name or an expression annotated under the key
+DIMENSIONS = {
+    'user': 'user',
+    'status': 'status',
+    'job_type': 'job_type',
+    'month': TruncMonth('applied_date'),
+}
+MEASURES = ('count', 'salary_sum', 'salary_count')
+
+
+def grouped_totals(queryset, dimensions=('status', 'job_type')):
+    """
+    Application count, salary sum and non-null salary count for every
+    combination of the given dimensions, in a single GROUP BY query.
+    """
+    unknown = set(dimensions) - set(DIMENSIONS)
+    if unknown:
+        raise ValueError(f"Unknown dimensions: {', '.join(sorted(unknown))}")
+
+    expressions = {
+        name: DIMENSIONS[name] for name in dimensions if not isinstance(DIMENSIONS[name], str)
+    }
+    return list(
+        queryset.order_by().annotate(**expressions).values(*dimensions).annotate(
+            count=Count('id'),
+            salary_sum=Sum('salary'),
+            salary_count=Count('salary'),
+        )
+    )
+
+
+def totals_by(rows, dimension, keys=()):
+    """Collapse grouped_totals rows onto one dimension, zero-filling the given keys"""
+    totals = {key: dict.fromkeys(MEASURES, 0) for key in keys}
+    for row in rows:
+        bucket = totals.setdefault(row[dimension], dict.fromkeys(MEASURES, 0))
+        for measure in MEASURES:
+            bucket[measure] += row[measure] or 0
+    return totals
@@ -0,0 +1,151 @@
+import threading
+from contextlib import contextmanager
+from datetime import date
+
+from django.db import transaction
+from django.db.models import Min
+
+from app.models import Application, DataVersion, User, UserApplicationSummary
+from app.utils.analytics import grouped_totals
+
+_state = threading.local()
+
+
+def _pending():
+    return getattr(_state, 'pending', None)
+
+
+@contextmanager
+def deferred_summaries():
+    """
+    Batch summary maintenance for bulk writes.
+
+    Inside the block the Application signals only record the affected
+    users, and each of them is rebuilt (and their DataVersion bumped) once
+    on exit. Writes that send no signals (bulk_create, bulk_update,
+    queryset.update) should report their users with mark_stale().
+    """
+    if _pending() is not None:
+        yield
+        return
+
+    _state.pending = set()
+    try:
+        yield
+    except BaseException:
+        # Only rebuild if whatever was written actually commits
+        pending = _state.pending
+        transaction.on_commit(lambda: _flush(pending))
+        raise
+    else:
+        _flush(_state.pending)
+    finally:
+        _state.pending = None
+
+
+def _flush(user_ids):
+    if user_ids:
+        rebuild_summaries(user_ids)
+        DataVersion.bump(user_ids)
+
+
+def mark_stale(user_ids):
+    """Rebuild the given users' summaries, or queue them inside deferred_summaries()"""
+    pending = _pending()
+    if pending is not None:
+        pending.update(user_ids)
+    else:
+        _flush(user_ids)
+
+
+def mark_changed(user_ids):
+    """Record an application write that leaves the summaries as they are"""
+    pending = _pending()
+    if pending is not None:
+        pending.update(user_ids)
+    else:
+        DataVersion.bump(user_ids)
+
+
+def next_interview_dates(user_ids, today=None):
+    """{user_id: earliest interview date from today on} for users with one scheduled"""
+    rows = Application.objects.filter(
+        user_id__in=user_ids,
+        status=Application.Status.INTERVIEW,
+        interview_date__gte=today or date.today(),
+    ).order_by().values('user').annotate(next_interview_date=Min('interview_date'))
+    return {row['user']: row['next_interview_date'] for row in rows}
+
+
+def rebuild_summaries(user_ids):
+    """Recompute the summaries of the given users from their applications. Returns the number rebuilt"""
+    user_ids = list(User.objects.filter(pk__in=list(user_ids)).values_list('pk', flat=True))
+    if not user_ids:
+        return 0
+
+    summaries = {user_id: UserApplicationSummary(user_id=user_id) for user_id in user_ids}
+    rows = grouped_totals(Application.objects.filter(user_id__in=user_ids), ('user', 'status', 'job_type'))
+    for row in rows:
+        summary = summaries[row['user']]
+        summary.total += row['count']
+        for counts, key, amount in (
+            (summary.status_counts, row['status'], row['count']),
+            (summary.job_type_counts, row['job_type'], row['count']),
+            (summary.salary_sums, row['job_type'], row['salary_sum'] or 0),
+            (summary.salary_counts, row['job_type'], row['salary_count']),
+        ):
+            counts[key] = counts.get(key, 0) + amount
+    for user_id, next_date in next_interview_dates(user_ids).items():
+        summaries[user_id].next_interview_date = next_date
+
+    UserApplicationSummary.objects.bulk_create(
+        summaries.values(),
+        update_conflicts=True,
+        unique_fields=['user'],
+        update_fields=[
+            'total', 'status_counts', 'job_type_counts', 'salary_sums', 'salary_counts',
+            'next_interview_date', 'updated_at',
+        ],
+    )
+    return len(summaries)
+
+
+def apply_change(old, new):
+    """
+    Move one application's contribution from old to new, each a
+    summary_values() dict or None for a create or delete.
+
+    Users without a summary row are skipped; get_summary() builds it from
+    scratch on the next read. Their DataVersion is bumped either way.
+    """
+    user_ids = {values['user_id'] for values in (old, new) if values}
+    pending = _pending()
+    if pending is not None:
+        pending.update(user_ids)
+        return
+
+    interview = Application.Status.INTERVIEW
+    with transaction.atomic():
+        for user_id in sorted(user_ids):
+            summary = UserApplicationSummary.objects.select_for_update().filter(user_id=user_id).first()
+            if summary is None:
+                continue
+            changes = [
+                (values, sign) for values, sign in ((old, -1), (new, 1))
+                if values and values['user_id'] == user_id
+            ]
+            for values, sign in changes:
+                summary.apply(values, sign)
+            if any(values['status'] == interview for values, _ in changes):
+                summary.next_interview_date = next_interview_dates([user_id]).get(user_id)
+            summary.save()
+        DataVersion.bump(user_ids)
+
+
+def get_summary(user):
+    """The user's summary, built on first use"""
+    summary = UserApplicationSummary.objects.filter(user=user).first()
+    if summary is None:
+        rebuild_summaries([user.pk])
+        summary = UserApplicationSummary.objects.get(user=user)
+    return summary
@@ -0,0 +1,188 @@
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+
+from django.conf import settings
+from django.db import close_old_connections
+
+from app.models import AuditLog
+
+logger = logging.getLogger(__name__)
+
+# Put on the queue at shutdown to wake a flusher waiting for a full batch
+_STOP = object()
+
+DEFAULTS = {
+    'ENABLED': True,
+    'MAX_QUEUE_SIZE': 10000,
+    'BATCH_SIZE': 500,
+    'FLUSH_INTERVAL': 2.0,
+    'SHUTDOWN_TIMEOUT': 5.0,
+}
+
+
+def get_buffer_settings():
+    """Merge AUDIT_LOG_BUFFER from settings over the defaults"""
+    return {**DEFAULTS, **getattr(settings, 'AUDIT_LOG_BUFFER', {})}
+
+
+class AuditLogBuffer:
+    """
+    In-process buffered writer for AuditLog records.
+
+    Request threads put unsaved AuditLog instances on a bounded queue and a
+    background thread writes them with bulk_create once BATCH_SIZE records are
+    waiting or FLUSH_INTERVAL seconds have passed. When the queue is full,
+    routine API_CALL records are dropped (and counted) while security-relevant
+    actions fall back to a synchronous INSERT, so loss is bounded to records
+    we can afford to lose. Whatever is still queued is written at shutdown.
+    """
+
+    def __init__(self, max_queue_size, batch_size, flush_interval, shutdown_timeout):
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.shutdown_timeout = shutdown_timeout
+        self.dropped = 0
+        self._lock = threading.Lock()
+        self._pid = None
+        self._queue = None
+        self._stop = None
+        self._thread = None
+
+    def enqueue(self, record):
+        """Queue an unsaved AuditLog for the background flusher"""
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            if record.action in AuditLog.SECURITY_ACTIONS:
+                record.save()
+            else:
+                with self._lock:
+                    self.dropped += 1
+                    dropped = self.dropped
+                if dropped % 1000 == 1:
+                    logger.warning('Audit log buffer full, %d record(s) dropped so far', dropped)
+
+    def flush(self):
+        """Synchronously write everything currently queued"""
+        if self._queue is None:
+            return
+        while True:
+            batch = self._drain(block=False)
+            if not batch:
+                return
+            self._write(batch)
+
+    def shutdown(self):
+        """Stop the flusher and write out any remaining records"""
+        if self._thread is None or self._pid != os.getpid():
+            return
+        self._stop.set()
+        try:
+            self._queue.put_nowait(_STOP)
+        except queue.Full:
+            pass
+        # The flusher drains the queue itself on its way out
+        self._thread.join(self.shutdown_timeout)
+        if self._thread.is_alive():
+            # Flushing now would race its in-flight batch
+            logger.warning(
+                'Audit log flusher did not stop within %.1fs; %d queued record(s) not written',
+                self.shutdown_timeout, self._queue.qsize(),
+            )
+            return
+        # Only records queued after the flusher's final drain are left
+        self.flush()
+
+    def _ensure_started(self):
+        # Worker processes forked after the buffer was created need their own
+        # queue and flusher thread; the parent's thread does not survive a fork.
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._queue = queue.Queue(maxsize=self.max_queue_size)
+            self._stop = threading.Event()
+            self._thread = threading.Thread(target=self._run, name='audit-log-flusher', daemon=True)
+            self._thread.start()
+            self._pid = os.getpid()
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                batch = self._drain(block=True)
+                if batch:
+                    self._write(batch)
+            except Exception:
+                logger.exception('Audit log flusher iteration failed')
+        try:
+            self.flush()
+        except Exception:
+            logger.exception('Audit log flusher failed to drain the queue at shutdown')
+
+    def _drain(self, block):
+        """Collect up to batch_size records, waiting at most flush_interval"""
+        batch = []
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            timeout = deadline - time.monotonic()
+            try:
+                if block and timeout > 0:
+                    record = self._queue.get(timeout=timeout)
+                else:
+                    record = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if record is _STOP:
+                break
+            batch.append(record)
+        return batch
+
+    def _write(self, batch):
+        close_old_connections()
+        try:
+            AuditLog.objects.bulk_create(batch, batch_size=self.batch_size)
+        except Exception:
+            with self._lock:
+                self.dropped += len(batch)
+            logger.exception('Failed to write %d audit log record(s)', len(batch))
+        finally:
+            close_old_connections()
+
+
+_buffer = None
+_buffer_lock = threading.Lock()
+
+
+def get_audit_buffer():
+    """Return the process-wide AuditLogBuffer, or None when buffering is disabled"""
+    global _buffer
+    config = get_buffer_settings()
+    if not config['ENABLED']:
+        return None
+    if _buffer is None:
+        with _buffer_lock:
+            if _buffer is None:
+                _buffer = AuditLogBuffer(
+                    max_queue_size=config['MAX_QUEUE_SIZE'],
+                    batch_size=config['BATCH_SIZE'],
+                    flush_interval=config['FLUSH_INTERVAL'],
+                    shutdown_timeout=config['SHUTDOWN_TIMEOUT'],
+                )
+                atexit.register(_buffer.shutdown)
+    return _buffer
+
+
+def write_audit_log(record):
+    """Write an AuditLog through the buffer, or immediately if buffering is off"""
+    audit_buffer = get_audit_buffer()
+    if audit_buffer is None:
+        record.save()
+    else:
+        audit_buffer.enqueue(record)
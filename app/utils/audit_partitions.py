@@ -0,0 +1,152 @@
+import gzip
+import os
+from datetime import datetime, timezone as dt_timezone
+
+from django.db import connection, transaction
+
+from app.models import AuditLog
+
+TABLE = AuditLog._meta.db_table
+DEFAULT_PARTITION = f'{TABLE}_default'
+
+
+def month_start(year, month):
+    """UTC datetime for the first instant of a month, normalising overflow"""
+    year += (month - 1) // 12
+    month = (month - 1) % 12 + 1
+    return datetime(year, month, 1, tzinfo=dt_timezone.utc)
+
+
+def partition_name(start):
+    return f'{TABLE}_p{start:%Y_%m}'
+
+
+def is_partitioned():
+    """True when audit_log is a PostgreSQL partitioned table"""
+    if connection.vendor != 'postgresql':
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT relkind FROM pg_class WHERE oid = to_regclass(%s)", [TABLE])
+        row = cursor.fetchone()
+    return bool(row) and row[0] == 'p'
+
+
+def list_partitions():
+    """Monthly partitions as (name, lower bound, upper bound), oldest first"""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT child.relname
+            FROM pg_inherits
+            JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE parent.relname = %s
+            ORDER BY child.relname
+            """,
+            [TABLE],
+        )
+        names = [row[0] for row in cursor.fetchall()]
+
+    partitions = []
+    for name in names:
+        if name == DEFAULT_PARTITION:
+            continue
+        year, month = name.rsplit('_p', 1)[1].split('_')
+        start = month_start(int(year), int(month))
+        partitions.append((name, start, month_start(start.year, start.month + 1)))
+    return partitions
+
+
+def create_partition(start):
+    """
+    Create the monthly partition beginning at start if it does not exist.
+
+    Rows that already landed in the default partition for that month are
+    moved into the new partition, which PostgreSQL requires before the
+    partition can be attached.
+    """
+    name = partition_name(start)
+    end = month_start(start.year, start.month + 1)
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute("SELECT to_regclass(%s)", [name])
+        if cursor.fetchone()[0] is not None:
+            return False
+
+        cursor.execute(
+            f'SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION} '
+            f'WHERE "timestamp" >= %s AND "timestamp" < %s)',
+            [start, end],
+        )
+        strays = cursor.fetchone()[0]
+        if strays:
+            cursor.execute(f'ALTER TABLE {TABLE} DETACH PARTITION {DEFAULT_PARTITION}')
+
+        cursor.execute(
+            f'CREATE TABLE {name} PARTITION OF {TABLE} FOR VALUES FROM (%s) TO (%s)',
+            [start, end],
+        )
+
+        if strays:
+            cursor.execute(
+                f'WITH moved AS (DELETE FROM {DEFAULT_PARTITION} '
+                f'WHERE "timestamp" >= %s AND "timestamp" < %s RETURNING *) '
+                f'INSERT INTO {name} SELECT * FROM moved',
+                [start, end],
+            )
+            cursor.execute(f'ALTER TABLE {TABLE} ATTACH PARTITION {DEFAULT_PARTITION} DEFAULT')
+    return True
+
+
+def ensure_partitions(months_ahead, now=None):
+    """Create partitions for the current month and months_ahead months after it"""
+    now = now or datetime.now(dt_timezone.utc)
+    created = []
+    for offset in range(months_ahead + 1):
+        start = month_start(now.year, now.month + offset)
+        if create_partition(start):
+            created.append(partition_name(start))
+    return created
+
+
+def drop_partition(name, archive_dir=None):
+    """
+    Archive a partition's rows when requested, then detach and drop it.
+
+    The archive is written while the partition is still attached, and the
+    detach and drop share one transaction, so a failure at any step leaves
+    the partition in place for the next retention run to retry.
+    Archives are gzipped CSV with a header row, one file per partition.
+    Returns the archive path, or None when the rows were discarded.
+    """
+    archive_path = None
+    if archive_dir:
+        os.makedirs(archive_dir, exist_ok=True)
+        archive_path = os.path.join(archive_dir, f'{name}.csv.gz')
+        partial_path = f'{archive_path}.partial'
+        try:
+            with gzip.open(partial_path, 'wb') as archive, connection.cursor() as cursor:
+                cursor.copy_expert(f'COPY {name} TO STDOUT WITH (FORMAT csv, HEADER)', archive)
+        except BaseException:
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+            raise
+        os.replace(partial_path, archive_path)
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f'ALTER TABLE {TABLE} DETACH PARTITION {name}')
+        cursor.execute(f'DROP TABLE {name}')
+    return archive_path
+
+
+def delete_before(cutoff, batch_size=10000):
+    """Batched DELETE fallback for databases without partitioning"""
+    deleted = 0
+    while True:
+        ids = list(
+            AuditLog.objects.filter(timestamp__lt=cutoff)
+            .order_by('id').values_list('id', flat=True)[:batch_size]
+        )
+        if not ids:
+            return deleted
+        count, _ = AuditLog.objects.filter(id__in=ids).delete()
+        deleted += count
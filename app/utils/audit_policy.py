@@ -0,0 +1,82 @@
+import random
+
+from django.conf import settings
+
+
+class AuditPolicy:
+    """
+    Decides whether an API call is audited and with what weight.
+
+    Modes:
+      always - log every call
+      sample - log a random `rate` fraction; each row carries weight 1/rate
+               so rollups can estimate the true number of calls
+      errors - log only responses with status >= 400
+      slow   - log only calls slower than `threshold` seconds
+      never  - log nothing
+    """
+    ALWAYS = 'always'
+    SAMPLE = 'sample'
+    ERRORS = 'errors'
+    SLOW = 'slow'
+    NEVER = 'never'
+    MODES = (ALWAYS, SAMPLE, ERRORS, SLOW, NEVER)
+
+    def __init__(self, mode=ALWAYS, rate=1.0, threshold=1.0):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown audit policy mode '{mode}'")
+        if mode == self.SAMPLE and not 0 < rate <= 1:
+            raise ValueError('Audit sample rate must be in (0, 1]')
+        self.mode = mode
+        self.rate = rate
+        self.threshold = threshold
+
+    @classmethod
+    def from_config(cls, config):
+        if isinstance(config, cls):
+            return config
+        return cls(
+            mode=config.get('mode', cls.ALWAYS),
+            rate=config.get('rate', 1.0),
+            threshold=config.get('threshold', 1.0),
+        )
+
+    def weight(self, status_code, response_time):
+        """Weight to store for this call, or None to skip logging it"""
+        if self.mode == self.ALWAYS:
+            return 1.0
+        if self.mode == self.SAMPLE:
+            return 1.0 / self.rate if random.random() < self.rate else None
+        if self.mode == self.ERRORS:
+            return 1.0 if status_code is not None and status_code >= 400 else None
+        if self.mode == self.SLOW:
+            return 1.0 if response_time >= self.threshold else None
+        return None
+
+
+def _method_config(config, method):
+    """Pick the per-method entry from {'GET': {...}} style configs"""
+    if 'mode' in config or isinstance(config, AuditPolicy):
+        return config
+    return config.get(method) or config.get('*')
+
+
+def resolve_policy(view, request):
+    """
+    Find the audit policy for a request.
+
+    A view's `audit_policy` attribute wins, then the first AUDIT_POLICIES
+    rule whose endpoint prefix and methods match, then AUDIT_DEFAULT_POLICY.
+    """
+    view_config = getattr(view, 'audit_policy', None)
+    if view_config:
+        config = _method_config(view_config, request.method)
+        if config:
+            return AuditPolicy.from_config(config)
+
+    for rule in getattr(settings, 'AUDIT_POLICIES', []):
+        methods = rule.get('methods')
+        if request.path.startswith(rule['endpoint']) and (not methods or request.method in methods):
+            return AuditPolicy.from_config(rule)
+
+    return AuditPolicy.from_config(getattr(settings, 'AUDIT_DEFAULT_POLICY', {}))
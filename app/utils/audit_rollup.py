@@ -0,0 +1,145 @@
+from collections import Counter
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Case, Count, F, IntegerField, Sum, Value, When
+from django.db.models.functions import Coalesce, Trunc
+from django.utils import timezone
+
+from app.models import AuditLog, AuditRollup, AuditRollupCheckpoint
+
+ROLLUP_KEY_FIELDS = ('bucket', 'user_id', 'action', 'endpoint', 'status_class')
+
+
+def status_class_expression():
+    """2 for 2xx, 4 for 4xx, ... and 0 when the status code is unknown"""
+    return Case(
+        When(status_code__isnull=True, then=Value(0)),
+        default=F('status_code') / 100,
+        output_field=IntegerField(),
+    )
+
+
+def unfolded_logs(checkpoint=None):
+    """AuditLog rows written since the last fold (or since the given checkpoint)"""
+    if checkpoint is None:
+        checkpoint = AuditRollupCheckpoint.current()
+    return AuditLog.objects.filter(id__gt=checkpoint)
+
+
+def fold_audit_logs(batch_size=50000, settle_seconds=60):
+    """
+    Fold the next batch of AuditLog rows into hourly and daily rollups.
+
+    Rows are folded in id order behind a checkpoint. Rows younger than
+    settle_seconds are left for the next run so inserts still in flight with
+    a lower id are not skipped. Returns the number of rows folded.
+    """
+    with transaction.atomic():
+        checkpoint, _ = AuditRollupCheckpoint.objects.select_for_update().get_or_create(pk=1)
+        start = checkpoint.last_log_id
+        settled_before = timezone.now() - timedelta(seconds=settle_seconds)
+        ids = list(AuditLog.objects.filter(
+            id__gt=start, timestamp__lt=settled_before,
+        ).order_by('id').values_list('id', flat=True)[:batch_size])
+        if not ids:
+            return 0
+        end = ids[-1]
+
+        logs = AuditLog.objects.filter(id__gt=start, id__lte=end).order_by()
+        for granularity in AuditRollup.Granularity.values:
+            groups = logs.annotate(
+                bucket=Trunc('timestamp', granularity),
+                status_class=status_class_expression(),
+            ).values(*ROLLUP_KEY_FIELDS).annotate(
+                count=Count('id'),
+                weight=Coalesce(Sum('weight'), 0.0),
+                total_response_time=Coalesce(Sum('response_time'), 0.0),
+            )
+            # Both granularities see the same rows, so either total will do
+            folded = _merge_groups(granularity, list(groups))
+
+        checkpoint.last_log_id = end
+        checkpoint.save()
+    return folded
+
+
+def _merge_groups(granularity, groups):
+    """Add aggregated groups onto existing rollup rows, creating missing ones"""
+    existing = {
+        tuple(getattr(rollup, field) for field in ROLLUP_KEY_FIELDS): rollup
+        for rollup in AuditRollup.objects.filter(
+            granularity=granularity,
+            bucket__in={group['bucket'] for group in groups},
+            user_id__in={group['user_id'] for group in groups},
+        )
+    }
+
+    to_create, to_update = [], []
+    for group in groups:
+        key = tuple(group[field] for field in ROLLUP_KEY_FIELDS)
+        rollup = existing.get(key)
+        if rollup is None:
+            to_create.append(AuditRollup(
+                granularity=granularity,
+                count=group['count'],
+                weight=group['weight'],
+                total_response_time=group['total_response_time'],
+                **dict(zip(ROLLUP_KEY_FIELDS, key)),
+            ))
+        else:
+            rollup.count += group['count']
+            rollup.weight += group['weight']
+            rollup.total_response_time += group['total_response_time']
+            to_update.append(rollup)
+
+    AuditRollup.objects.bulk_create(to_create, batch_size=1000)
+    AuditRollup.objects.bulk_update(to_update, ['count', 'weight', 'total_response_time'], batch_size=1000)
+    return sum(group['count'] for group in groups)
+
+
+def prune_hourly_rollups(retention_days):
+    """Delete hourly buckets older than retention_days; daily buckets are kept"""
+    cutoff = timezone.now() - timedelta(days=retention_days)
+    deleted, _ = AuditRollup.objects.filter(
+        granularity=AuditRollup.Granularity.HOUR, bucket__lt=cutoff,
+    ).delete()
+    return deleted
+
+
+def count_actions(since=None, action=None, checkpoint=None):
+    """
+    Estimated calls per action from the daily rollups plus the unfolded tail.
+    Sampled rows count for their weight. since must fall on a day boundary
+    in the current time zone. Pass AuditRollupCheckpoint.current() as
+    checkpoint to share one read of it between several calls.
+    """
+    rollups = AuditRollup.objects.filter(granularity=AuditRollup.Granularity.DAY)
+    tail = unfolded_logs(checkpoint)
+    if since is not None:
+        rollups = rollups.filter(bucket__gte=since)
+        tail = tail.filter(timestamp__gte=since)
+    if action is not None:
+        rollups = rollups.filter(action=action)
+        tail = tail.filter(action=action)
+
+    counts = Counter()
+    for row in rollups.values('action').annotate(total=Sum('weight')).order_by():
+        counts[row['action']] += row['total']
+    for row in tail.values('action').annotate(total=Sum('weight')).order_by():
+        counts[row['action']] += row['total']
+    return Counter({action: round(total) for action, total in counts.items()})
+
+
+def top_users(limit=10, checkpoint=None):
+    """Most active usernames over all history, weighted like count_actions"""
+    counts = Counter()
+    rollups = AuditRollup.objects.filter(granularity=AuditRollup.Granularity.DAY)
+    for row in rollups.values('user__username').annotate(total=Sum('weight')).order_by():
+        counts[row['user__username']] += row['total']
+    for row in unfolded_logs(checkpoint).values('user__username').annotate(total=Sum('weight')).order_by():
+        counts[row['user__username']] += row['total']
+    return [
+        {'user__username': username, 'activity_count': round(total)}
+        for username, total in counts.most_common(limit)
+    ]
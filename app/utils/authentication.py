@@ -1,5 +1,86 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
 from rest_framework_simplejwt.authentication import JWTAuthentication
-from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+
+class ExpiringLRUCache:
+    """Thread-safe LRU whose entries each carry their own expiry timestamp"""
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires = entry
+            if expires <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, expires):
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (value, expires)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+access_token_cache = ExpiringLRUCache(settings.AUTH_CACHE['TOKEN_MAX_ENTRIES'])
+user_cache = ExpiringLRUCache(settings.AUTH_CACHE['USER_MAX_ENTRIES'])
+
+
+def _user_cache_key(user_id):
+    # Token claims may carry the id as a string
+    return f'auth:user:{user_id}'
+
+
+def get_cached_user(user_id):
+    alias = settings.AUTH_CACHE['USER_CACHE_ALIAS']
+    if alias:
+        return caches[alias].get(_user_cache_key(user_id))
+    return user_cache.get(_user_cache_key(user_id))
+
+
+def cache_user(user):
+    ttl = settings.AUTH_CACHE['USER_TTL']
+    alias = settings.AUTH_CACHE['USER_CACHE_ALIAS']
+    if alias:
+        caches[alias].set(_user_cache_key(user.pk), user, ttl)
+    else:
+        user_cache.set(_user_cache_key(user.pk), user, time.time() + ttl)
+
+
+def invalidate_cached_user(user_id):
+    """Drop a user from the authentication cache after it was saved or deleted"""
+    alias = settings.AUTH_CACHE['USER_CACHE_ALIAS']
+    if alias:
+        caches[alias].delete(_user_cache_key(user_id))
+    else:
+        user_cache.delete(_user_cache_key(user_id))
+
 
 class CookieJWTAuthentication(JWTAuthentication):
     """
@@ -9,12 +90,45 @@ class CookieJWTAuthentication(JWTAuthentication):
         token = request.COOKIES.get("access")
         if not token:
             return None
-        try:
-            validated_token = self.get_validated_token(token)
-        except AuthenticationFailed as e:
-            raise AuthenticationFailed(f"Token validation failed: {str(e)}")
+        # Already validated by TokenExpirationMiddleware for this request
+        validated_token = getattr(request, 'validated_access_token', None)
+        if validated_token is None:
+            try:
+                validated_token = self.get_validated_token(token)
+            except AuthenticationFailed as e:
+                raise AuthenticationFailed(f"Token validation failed: {str(e)}")
         try:
             user = self.get_user(validated_token)
             return user, validated_token
         except AuthenticationFailed as e:
-            raise AuthenticationFailed(f"Error retrieving user: {str(e)}") 
\ No newline at end of file
+            raise AuthenticationFailed(f"Error retrieving user: {str(e)}")
+
+    def get_validated_token(self, raw_token):
+        """
+        Skip decoding and signature checks for access tokens seen before.
+        Entries are keyed by the whole token, so any change to its header or
+        payload misses the cache. Refresh tokens are never cached because
+        they can be blacklisted before they expire.
+        """
+        validated_token = access_token_cache.get(raw_token)
+        if validated_token is None:
+            validated_token = super().get_validated_token(raw_token)
+            if validated_token.get(api_settings.TOKEN_TYPE_CLAIM) == 'access':
+                access_token_cache.set(raw_token, validated_token, validated_token['exp'])
+        return validated_token
+
+    def get_user(self, validated_token):
+        """
+        Serve the user from the authentication cache, loading it on a miss.
+        Each request gets its own copy so views cannot change the cached one.
+        """
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken("Token contained no recognizable user identification")
+        user = get_cached_user(user_id)
+        if user is None:
+            # Raises for missing and inactive users, which are never cached
+            user = super().get_user(validated_token)
+            cache_user(user)
+        return copy.copy(user)
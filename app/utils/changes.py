@@ -0,0 +1,132 @@
+import base64
+import json
+import threading
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from app.models import Application, ApplicationTombstone
+from app.utils.pagination import InvalidCursor
+
+# Changes are ordered by (time, kind, id); an upsert sorts before a delete at the same instant
+UPSERT, DELETE = 0, 1
+
+
+_state = threading.local()
+# Pending-tombstones marker for blocks that must not record any
+_SUPPRESSED = object()
+
+
+@contextmanager
+def deferred_tombstones(record=True):
+    """
+    Batch the tombstones of deleted applications.
+
+    Inside the block the delete signal queues tombstones and they are
+    written with one bulk_create on exit. With record=False none are
+    written, for deletes whose owner is going away too.
+    """
+    if getattr(_state, 'pending', None) is not None:
+        yield
+        return
+
+    _state.pending = [] if record else _SUPPRESSED
+    try:
+        yield
+    except BaseException:
+        # Only write them if the deletes actually commit
+        pending = _state.pending
+        transaction.on_commit(lambda: _write_tombstones(pending))
+        raise
+    else:
+        _write_tombstones(_state.pending)
+    finally:
+        _state.pending = None
+
+
+def _write_tombstones(tombstones):
+    if tombstones is not _SUPPRESSED and tombstones:
+        ApplicationTombstone.objects.bulk_create(tombstones, batch_size=1000)
+
+
+def record_tombstone(user_id, application_id):
+    """Record a deleted application, or queue it inside deferred_tombstones()"""
+    pending = getattr(_state, 'pending', None)
+    if pending is _SUPPRESSED:
+        return
+    tombstone = ApplicationTombstone(user_id=user_id, application_id=application_id)
+    if pending is None:
+        tombstone.save()
+    else:
+        pending.append(tombstone)
+
+
+class ExpiredCursor(Exception):
+    """Raised when a cursor predates the tombstone retention window"""
+
+
+def encode_cursor(when, kind, pk):
+    payload = {'t': when.isoformat(), 'k': kind, 'i': pk}
+    raw = json.dumps(payload, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        when = parse_datetime(payload['t'])
+        kind, pk = int(payload['k']), int(payload['i'])
+    except Exception as exc:
+        raise InvalidCursor('Invalid cursor') from exc
+    if when is None or kind not in (UPSERT, DELETE):
+        raise InvalidCursor('Invalid cursor')
+    return when, kind, pk
+
+
+def application_changes(user, cursor=None, limit=100):
+    """
+    The user's application upserts and deletions after cursor, oldest
+    first, as (changes, next_cursor, has_more). Each change is
+    (kind, Application) for an upsert or (kind, ApplicationTombstone).
+
+    Rows written in the last SETTLE_SECONDS are held back so that a
+    transaction committing late with an earlier timestamp is not skipped.
+    """
+    options = settings.APPLICATION_CHANGES
+    until = timezone.now() - timedelta(seconds=options['SETTLE_SECONDS'])
+    upserts = Application.objects.filter(user=user, updated_at__lte=until)
+    deletes = ApplicationTombstone.objects.filter(user=user, deleted_at__lte=until)
+
+    if cursor:
+        when, kind, pk = decode_cursor(cursor)
+        if when < timezone.now() - timedelta(days=options['TOMBSTONE_RETENTION_DAYS']):
+            raise ExpiredCursor('Cursor has expired; run a full sync')
+        if kind == UPSERT:
+            upserts = upserts.filter(Q(updated_at__gt=when) | Q(updated_at=when, id__gt=pk))
+            deletes = deletes.filter(deleted_at__gte=when)
+        else:
+            upserts = upserts.filter(updated_at__gt=when)
+            deletes = deletes.filter(Q(deleted_at__gt=when) | Q(deleted_at=when, id__gt=pk))
+
+    # Each stream's first limit + 1 rows hold every row of the merged first limit + 1
+    merged = sorted(
+        [(row.updated_at, UPSERT, row.id, row) for row in upserts.order_by('updated_at', 'id')[:limit + 1]]
+        + [(row.deleted_at, DELETE, row.id, row) for row in deletes.order_by('deleted_at', 'id')[:limit + 1]],
+        key=lambda change: change[:3],
+    )
+    page = merged[:limit]
+    next_cursor = encode_cursor(*page[-1][:3]) if page else cursor
+    return [(kind, row) for _, kind, _, row in page], next_cursor, len(merged) > limit
+
+
+def prune_tombstones(retention_days):
+    """Delete tombstones older than the retention window"""
+    cutoff = timezone.now() - timedelta(days=retention_days)
+    deleted, _ = ApplicationTombstone.objects.filter(deleted_at__lt=cutoff).delete()
+    return deleted
@@ -0,0 +1,22 @@
+class InvalidFields(Exception):
+    """Raised when ?fields= names something the resource does not have"""
+
+
+def requested_fields(request, serializer_class):
+    """
+    Output keys selected with ?fields=a,b for a SparseFieldsMixin
+    serializer, in the serializer's order; None when the parameter is absent.
+    """
+    raw = request.GET.get('fields')
+    if raw is None:
+        return None
+    names = {name.strip() for name in raw.split(',') if name.strip()}
+    available = serializer_class.output_fields
+    if not names:
+        raise InvalidFields("'fields' must name at least one field")
+    unknown = sorted(names - set(available))
+    if unknown:
+        raise InvalidFields(
+            f"Unknown field(s): {', '.join(unknown)}. Available fields: {', '.join(available)}"
+        )
+    return [key for key in available if key in names]
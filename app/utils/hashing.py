@@ -0,0 +1,71 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+
+class HashingBusy(APIException):
+    """Raised when the password hashing pool is full; answered with 503 and Retry-After"""
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = 'Too many sign-in attempts in progress, please retry shortly.'
+    default_code = 'hashing_busy'
+
+    def __init__(self, wait):
+        super().__init__()
+        self.wait = wait
+
+
+class HashingPool:
+    """
+    Runs password hashing on MAX_WORKERS dedicated threads. Up to MAX_QUEUE
+    more calls wait for a thread, each for at most QUEUE_TIMEOUT seconds;
+    anything beyond that is rejected with HashingBusy straight away.
+    """
+
+    def __init__(self):
+        self._executor = None
+        self._slots = None
+        self._lock = threading.Lock()
+
+    def _start(self):
+        with self._lock:
+            if self._executor is None:
+                options = settings.PASSWORD_HASHING
+                self._slots = threading.BoundedSemaphore(options['MAX_WORKERS'] + options['MAX_QUEUE'])
+                self._executor = ThreadPoolExecutor(options['MAX_WORKERS'], thread_name_prefix='password-hashing')
+
+    def run(self, func, *args):
+        options = settings.PASSWORD_HASHING
+        if not options['ENABLED']:
+            return func(*args)
+        if self._executor is None:
+            self._start()
+        if not self._slots.acquire(blocking=False):
+            raise HashingBusy(options['RETRY_AFTER'])
+        try:
+            future = self._executor.submit(func, *args)
+            try:
+                return future.result(timeout=options['QUEUE_TIMEOUT'])
+            except TimeoutError:
+                # Still queued: drop it rather than hash for a client that got a 503
+                if future.cancel():
+                    raise HashingBusy(options['RETRY_AFTER'])
+                return future.result()
+        finally:
+            self._slots.release()
+
+
+hashing_pool = HashingPool()
+
+
+class PooledPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """
+    Django's default hasher with the key derivation moved onto hashing_pool,
+    so authenticate() and set_password() share one CPU budget per process.
+    """
+
+    def encode(self, password, salt, iterations=None):
+        return hashing_pool.run(super().encode, password, salt, iterations)
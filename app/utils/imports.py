@@ -0,0 +1,134 @@
+import codecs
+import csv
+import json
+from itertools import islice
+
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage
+from django.db import transaction
+
+from app.models import Application
+from app.serializers.application import ApplicationCreateUpdateSerializer
+from app.utils.application_summary import deferred_summaries, mark_stale
+
+FORMATS = ('csv', 'ndjson')
+# Accepted column names besides the model field names, matching the API's output keys
+COLUMN_ALIASES = {
+    'appliedDate': 'applied_date',
+    'interviewDate': 'interview_date',
+    'followUpDate': 'follow_up_date',
+    'jobType': 'job_type',
+}
+
+
+class InvalidImport(Exception):
+    """Raised when an upload cannot be read as the requested format"""
+
+
+def import_storage():
+    """Where uploads wait for the background import job"""
+    return FileSystemStorage(location=settings.APPLICATION_IMPORT['UPLOAD_DIR'])
+
+
+def detect_format(filename, requested=None):
+    if requested:
+        if requested not in FORMATS:
+            raise InvalidImport(f"Unsupported type '{requested}', expected one of {', '.join(FORMATS)}")
+        return requested
+    extension = filename.rsplit('.', 1)[-1].lower() if '.' in filename else ''
+    if extension == 'csv':
+        return 'csv'
+    if extension in ('ndjson', 'jsonl'):
+        return 'ndjson'
+    raise InvalidImport("Cannot tell the file type from its name; pass type=csv or type=ndjson")
+
+
+def _clean(row):
+    """Map column aliases to field names and drop blank cells so model defaults apply"""
+    cleaned = {}
+    for key, value in row.items():
+        if key is None or value is None or value == '':
+            continue
+        cleaned[COLUMN_ALIASES.get(key.strip(), key.strip())] = value
+    return cleaned
+
+
+def read_rows(file, file_format):
+    """
+    Yield (row_number, data, error) for each record of a binary file,
+    reading it line by line. Exactly one of data and error is set.
+    """
+    lines = codecs.iterdecode(file, 'utf-8-sig')
+    if file_format == 'csv':
+        reader = csv.DictReader(lines)
+        try:
+            for row in reader:
+                # line_num is the physical line the record ends on
+                yield reader.line_num, _clean(row), None
+        except (csv.Error, UnicodeDecodeError) as exc:
+            raise InvalidImport(f"Invalid CSV near line {reader.line_num}: {exc}") from exc
+        return
+
+    row_number = 0
+    try:
+        for row_number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as exc:
+                yield row_number, None, {'non_field_errors': [f'Invalid JSON: {exc}']}
+                continue
+            if not isinstance(row, dict):
+                yield row_number, None, {'non_field_errors': ['Expected a JSON object']}
+                continue
+            yield row_number, _clean(row), None
+    except UnicodeDecodeError as exc:
+        raise InvalidImport(f"File is not valid UTF-8 near line {row_number + 1}") from exc
+
+
+def import_applications(user, rows, resume=None, on_chunk=None):
+    """
+    Validate rows from read_rows() and insert the valid ones for user in
+    CHUNK_SIZE bulk_create batches, each committed on its own.
+
+    Pass the totals reported by an interrupted run as resume to skip the
+    rows it already committed. on_chunk is called with the running totals
+    inside every chunk's transaction. Returns {'processed', 'created', 'error_count',
+    'errors'}; only the first MAX_REPORTED_ERRORS row errors are listed.
+    """
+    options = settings.APPLICATION_IMPORT
+    totals = {'processed': 0, 'created': 0, 'error_count': 0, 'errors': []}
+    totals.update(resume or {})
+    rows = islice(rows, totals['processed'], None)
+
+    def record_error(row_number, errors):
+        totals['error_count'] += 1
+        if len(totals['errors']) < options['MAX_REPORTED_ERRORS']:
+            totals['errors'].append({'row': row_number, 'errors': errors})
+
+    with deferred_summaries():
+        while True:
+            chunk = list(islice(rows, options['CHUNK_SIZE']))
+            if not chunk:
+                break
+            applications = []
+            for row_number, data, error in chunk:
+                if error:
+                    record_error(row_number, error)
+                    continue
+                serializer = ApplicationCreateUpdateSerializer(data=data)
+                if not serializer.is_valid():
+                    record_error(row_number, serializer.errors)
+                    continue
+                applications.append(Application(user=user, **serializer.validated_data))
+
+            totals['processed'] += len(chunk)
+            totals['created'] += len(applications)
+            # Progress commits with the chunk, so a resumed run neither skips nor repeats it
+            with transaction.atomic():
+                Application.objects.bulk_create(applications)
+                mark_stale([user.pk])
+                if on_chunk:
+                    on_chunk(totals)
+    return totals
@@ -0,0 +1,96 @@
+from itertools import groupby
+from math import floor
+
+from django.db import connection
+from django.db.models import Aggregate, Count, FloatField, Sum
+from django.db.models.functions import Trunc
+
+from app.models import AuditLog
+from app.utils.audit_rollup import status_class_expression
+
+PERCENTILES = (('p50', 0.5), ('p95', 0.95), ('p99', 0.99))
+SERIES_KEY = ('endpoint', 'method', 'status_class')
+
+
+class PercentileCont(Aggregate):
+    """PostgreSQL percentile_cont ordered-set aggregate"""
+    function = 'percentile_cont'
+    template = '%(function)s(%(percentile)s) WITHIN GROUP (ORDER BY %(expressions)s)'
+    output_field = FloatField()
+
+    def __init__(self, expression, percentile, **extra):
+        if not 0 <= percentile <= 1:
+            raise ValueError('percentile must be between 0 and 1')
+        super().__init__(expression, percentile=float(percentile), **extra)
+
+
+def percentile_cont(sorted_values, fraction):
+    """Linear-interpolated percentile, matching PostgreSQL's percentile_cont"""
+    if not sorted_values:
+        return None
+    position = fraction * (len(sorted_values) - 1)
+    lower = floor(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def latency_stats(queryset, bucket=None):
+    """
+    Request count, estimated call count and p50/p95/p99 response times
+    grouped by endpoint, method and status class, and by time bucket when
+    bucket ('minute', 'hour' or 'day') is given.
+
+    On PostgreSQL the percentiles are computed by the database; elsewhere
+    the response times are streamed in sorted order and computed here.
+    """
+    queryset = queryset.filter(response_time__isnull=False).order_by().annotate(
+        status_class=status_class_expression(),
+    )
+    group_by = list(SERIES_KEY)
+    if bucket:
+        queryset = queryset.annotate(bucket=Trunc('timestamp', bucket))
+        group_by.append('bucket')
+
+    if connection.vendor == 'postgresql':
+        rows = queryset.values(*group_by).annotate(
+            count=Count('id'),
+            estimated_count=Sum('weight'),
+            **{name: PercentileCont('response_time', fraction) for name, fraction in PERCENTILES},
+        ).order_by(*group_by)
+        return list(rows)
+
+    rows = queryset.values_list(*group_by, 'response_time', 'weight').order_by(*group_by, 'response_time')
+    stats = []
+    for key, group in groupby(rows.iterator(), key=lambda row: row[:len(group_by)]):
+        group = list(group)
+        times = [row[-2] for row in group]
+        stat = dict(zip(group_by, key))
+        stat['count'] = len(group)
+        stat['estimated_count'] = sum(row[-1] for row in group)
+        for name, fraction in PERCENTILES:
+            stat[name] = percentile_cont(times, fraction)
+        stats.append(stat)
+    return stats
+
+
+def latency_series(since, bucket, endpoint=None, method=None):
+    """Latency time series per endpoint/method/status class plus a window summary"""
+    queryset = AuditLog.objects.filter(timestamp__gte=since)
+    if endpoint:
+        queryset = queryset.filter(endpoint=endpoint)
+    if method:
+        queryset = queryset.filter(method=method.upper())
+
+    series = []
+    for key, points in groupby(latency_stats(queryset, bucket), key=lambda row: tuple(row[k] for k in SERIES_KEY)):
+        series.append({
+            **dict(zip(SERIES_KEY, key)),
+            'points': [
+                {name: value for name, value in point.items() if name not in SERIES_KEY}
+                for point in points
+            ],
+        })
+    return {
+        'series': series,
+        'summary': latency_stats(queryset),
+    }
@@ -1,6 +1,108 @@
+import base64
+import json
+
+from django.db.models import Q
 from rest_framework.pagination import PageNumberPagination
 
 class CustomPageNumberPagination(PageNumberPagination):
     page_size = 5
     page_size_query_param = 'page_size'
-    max_page_size = 100 
\ No newline at end of file
+    max_page_size = 100
+
+
+class InvalidCursor(Exception):
+    """Raised when a pagination cursor cannot be decoded"""
+
+
+def positive_int(value, name, default, maximum=None):
+    """
+    Parse a page or page_size query parameter, capped at maximum.
+    Raises ValueError naming the parameter when it is not a positive integer.
+    """
+    if value is None or value == '':
+        return default
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        number = 0
+    if number < 1:
+        raise ValueError(f"'{name}' must be a positive integer")
+    return min(number, maximum) if maximum else number
+
+
+class KeysetPaginator:
+    """
+    Cursor pagination over an ordered (field, id) keyset.
+
+    Each page is a range scan that starts right after the previous page's
+    boundary row, so the cost of a page does not depend on how deep it is.
+    Cursors are opaque url-safe tokens carrying the boundary row's key and
+    the direction to move in.
+    """
+
+    def __init__(self, field, descending=True, page_size=50, max_page_size=500):
+        self.field = field
+        self.descending = descending
+        self.page_size = page_size
+        self.max_page_size = max_page_size
+
+    def ordering(self, reverse=False):
+        descending = self.descending != reverse
+        prefix = '-' if descending else ''
+        return (f'{prefix}{self.field}', f'{prefix}id')
+
+    def get_page_size(self, value):
+        try:
+            page_size = int(value)
+        except (TypeError, ValueError):
+            return self.page_size
+        return max(1, min(page_size, self.max_page_size))
+
+    def paginate(self, queryset, cursor=None, page_size=None):
+        """Return (items, next_cursor, prev_cursor) for the page after or before cursor"""
+        page_size = page_size or self.page_size
+        backwards = False
+        if cursor:
+            value, pk, backwards = self.decode(queryset.model, cursor)
+            queryset = queryset.filter(self._after(value, pk, reverse=backwards))
+
+        rows = list(queryset.order_by(*self.ordering(reverse=backwards))[:page_size + 1])
+        has_more = len(rows) > page_size
+        items = rows[:page_size]
+        if backwards:
+            items.reverse()
+
+        # Moving backwards we came from a later page; moving forwards from a
+        # cursor we came from an earlier one
+        has_next = True if backwards else has_more
+        has_prev = has_more if backwards else bool(cursor)
+
+        next_cursor = prev_cursor = None
+        if items and has_next:
+            next_cursor = self.encode(items[-1], backwards=False)
+        if items and has_prev:
+            prev_cursor = self.encode(items[0], backwards=True)
+        return items, next_cursor, prev_cursor
+
+    def _after(self, value, pk, reverse):
+        """Rows strictly after (value, pk) in the requested direction"""
+        before = self.descending != reverse
+        if before:
+            return Q(**{f'{self.field}__lte': value}) & (Q(**{f'{self.field}__lt': value}) | Q(id__lt=pk))
+        return Q(**{f'{self.field}__gte': value}) & (Q(**{f'{self.field}__gt': value}) | Q(id__gt=pk))
+
+    def encode(self, item, backwards):
+        value = item[self.field] if isinstance(item, dict) else getattr(item, self.field)
+        pk = item['id'] if isinstance(item, dict) else item.id
+        payload = {'v': value.isoformat(), 'i': pk, 'b': int(backwards)}
+        raw = json.dumps(payload, separators=(',', ':')).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+    def decode(self, model, cursor):
+        try:
+            raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+            payload = json.loads(raw)
+            value = model._meta.get_field(self.field).to_python(payload['v'])
+            return value, int(payload['i']), bool(payload['b'])
+        except Exception as exc:
+            raise InvalidCursor('Invalid cursor') from exc
@@ -0,0 +1,63 @@
+import time
+
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.db import connection
+from django.db.models import Case, FloatField, IntegerField, Q, Value, When
+from django.db.models.functions import Greatest
+
+SEARCH_FIELDS = ('company', 'position')
+# How long a pg_trgm check is trusted; the extension may be installed later
+TRIGRAM_CHECK_TTL = 300  # seconds
+_trigram_check = (None, 0.0)  # (available, checked at)
+
+
+def trigram_available():
+    """Whether the database has pg_trgm installed for similarity ranking"""
+    global _trigram_check
+    if connection.vendor != 'postgresql':
+        return False
+    available, checked_at = _trigram_check
+    if available is None or time.monotonic() - checked_at > TRIGRAM_CHECK_TTL:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+            available = cursor.fetchone() is not None
+        _trigram_check = (available, time.monotonic())
+    return available
+
+
+def search_applications(queryset, query):
+    """
+    Applications whose company or position contains query, annotated with
+    a search_rank: 3 for an exact match, 2 for a prefix match, 1 otherwise.
+
+    On PostgreSQL the containment filter is served by the trigram indexes,
+    and search_similarity (pg_trgm word similarity) breaks rank ties.
+    Elsewhere search_similarity is 0.
+    """
+    query = query.strip()
+    if not query:
+        return queryset
+
+    match = Q()
+    for field in SEARCH_FIELDS:
+        match |= Q(**{f'{field}__icontains': query})
+
+    ranks = []
+    for rank, lookup in ((3, 'iexact'), (2, 'istartswith')):
+        for field in SEARCH_FIELDS:
+            ranks.append(When(Q(**{f'{field}__{lookup}': query}), then=Value(rank)))
+
+    if trigram_available():
+        similarity = Greatest(*(TrigramWordSimilarity(query, field) for field in SEARCH_FIELDS))
+    else:
+        similarity = Value(0.0, output_field=FloatField())
+
+    return queryset.filter(match).annotate(
+        search_rank=Case(*ranks, default=Value(1), output_field=IntegerField()),
+        search_similarity=similarity,
+    )
+
+
+def search_ordering(*tiebreakers):
+    """Order by relevance first, then by the given fields"""
+    return ('-search_rank', '-search_similarity', *tiebreakers)
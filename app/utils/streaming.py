@@ -0,0 +1,62 @@
+import csv
+
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
+
+_EXHAUSTED = object()
+
+
+class Echo:
+    """File-like object whose write() hands the line back to the caller"""
+    def write(self, value):
+        return value
+
+
+def csv_lines(header, rows):
+    """Yield CSV-encoded lines for a header and an iterable of row tuples"""
+    writer = csv.writer(Echo())
+    yield writer.writerow(header)
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def chunked(lines, size=500):
+    """Join lines into larger chunks so each write to the client carries more data"""
+    buffer = []
+    for line in lines:
+        buffer.append(line)
+        if len(buffer) >= size:
+            yield ''.join(buffer)
+            buffer = []
+    if buffer:
+        yield ''.join(buffer)
+
+
+async def _iterate_async(iterable):
+    # Each step runs in the request's thread-sensitive executor, so a
+    # server-side cursor stays on the connection that opened it
+    iterator = iter(iterable)
+    step = sync_to_async(next, thread_sensitive=True)
+    while True:
+        chunk = await step(iterator, _EXHAUSTED)
+        if chunk is _EXHAUSTED:
+            return
+        yield chunk
+
+
+def streaming_response(request, iterable, content_type, filename=None):
+    """
+    Stream a generator to the client.
+
+    Django materializes synchronous iterators when serving under ASGI, so
+    there the generator is wrapped in an async iterator that pulls one chunk
+    at a time.
+    """
+    django_request = getattr(request, '_request', request)
+    if isinstance(django_request, ASGIRequest):
+        iterable = _iterate_async(iterable)
+    response = StreamingHttpResponse(iterable, content_type=content_type)
+    if filename:
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
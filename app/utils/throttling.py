@@ -0,0 +1,136 @@
+import threading
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.utils import timezone
+from rest_framework.throttling import BaseThrottle
+
+from app.models import ThrottleBucket
+from app.utils.authentication import ExpiringLRUCache
+
+DURATIONS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+
+def parse_rate(rate):
+    """'10/min' -> (capacity 10, refill 10/60 tokens per second), DRF's rate syntax"""
+    num, period = rate.split('/')
+    capacity = int(num)
+    return capacity, capacity / DURATIONS[period[0]]
+
+
+def refill(tokens, elapsed, capacity, rate):
+    """
+    Take one token from a bucket holding `tokens` as of `elapsed` seconds ago.
+    Returns (tokens left, seconds to wait; 0 when the request may go ahead).
+    """
+    tokens = min(capacity, tokens + elapsed * rate)
+    if tokens >= 1:
+        return tokens - 1, 0
+    return tokens, (1 - tokens) / rate
+
+
+class LocalBuckets:
+    """Buckets in this process only; each worker enforces the full rate on its own"""
+
+    def __init__(self):
+        self._buckets = ExpiringLRUCache(settings.THROTTLING['LOCAL_MAX_ENTRIES'])
+        self._lock = threading.Lock()
+
+    def take(self, key, capacity, rate):
+        with self._lock:
+            now = time.time()
+            tokens, updated = self._buckets.get(key) or (capacity, now)
+            tokens, wait = refill(tokens, now - updated, capacity, rate)
+            # Once the bucket would be full again, forgetting it changes nothing
+            self._buckets.set(key, (tokens, now), now + (capacity - tokens) / rate)
+            return wait
+
+
+class CacheBuckets:
+    """
+    Buckets in a Django cache shared by all workers. The read and write are
+    not atomic, so concurrent requests may occasionally both get the last token.
+    """
+
+    def take(self, key, capacity, rate):
+        cache = caches[settings.THROTTLING['CACHE_ALIAS']]
+        now = time.time()
+        tokens, updated = cache.get(key) or (capacity, now)
+        tokens, wait = refill(tokens, now - updated, capacity, rate)
+        cache.set(key, (tokens, now), (capacity - tokens) / rate + 1)
+        return wait
+
+
+class DatabaseBuckets:
+    """Buckets in the throttle_bucket table, updated under a row lock"""
+
+    def take(self, key, capacity, rate):
+        with transaction.atomic():
+            now = timezone.now()
+            bucket, _ = ThrottleBucket.objects.select_for_update().get_or_create(
+                key=key, defaults={'tokens': capacity, 'updated_at': now},
+            )
+            elapsed = (now - bucket.updated_at).total_seconds()
+            bucket.tokens, wait = refill(bucket.tokens, elapsed, capacity, rate)
+            bucket.updated_at = now
+            bucket.save(update_fields=['tokens', 'updated_at'])
+            return wait
+
+
+BACKENDS = {'local': LocalBuckets, 'cache': CacheBuckets, 'database': DatabaseBuckets}
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def get_backend():
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            _backend = BACKENDS[settings.THROTTLING['BACKEND']]()
+        return _backend
+
+
+def prune_buckets(older_than=timedelta(days=1)):
+    """Delete database buckets untouched for a while; they would have refilled anyway"""
+    deleted, _ = ThrottleBucket.objects.filter(updated_at__lt=timezone.now() - older_than).delete()
+    return deleted
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """
+    Token-bucket throttle for views that set `throttle_scope`, either for
+    all methods ('login') or per method ({'POST': 'application_write'}).
+
+    The scope's rate comes from REST_FRAMEWORK['DEFAULT_THROTTLE_RATES'];
+    'N/period' allows bursts of N that refill evenly over the period.
+    Buckets are kept per user, or per client IP for anonymous requests.
+    """
+
+    def allow_request(self, request, view):
+        self.wait_seconds = None
+        scope = getattr(view, 'throttle_scope', None)
+        if isinstance(scope, dict):
+            scope = scope.get(request.method) or scope.get('*')
+        rate = settings.REST_FRAMEWORK.get('DEFAULT_THROTTLE_RATES', {}).get(scope) if scope else None
+        if rate is None:
+            return True
+
+        # app.mixins imports APIView, which loads this module as a default throttle
+        from app.mixins.audit import get_client_ip
+
+        if request.user and request.user.is_authenticated:
+            ident = f'user:{request.user.pk}'
+        else:
+            ident = f'ip:{get_client_ip(request)}'
+        capacity, refill_rate = parse_rate(rate)
+        wait = get_backend().take(f'throttle:{scope}:{ident}', capacity, refill_rate)
+        if wait:
+            self.wait_seconds = wait
+            return False
+        return True
+
+    def wait(self):
+        return self.wait_seconds
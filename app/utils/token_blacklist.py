@@ -0,0 +1,102 @@
+import threading
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.tokens import RefreshToken as BaseRefreshToken
+from rest_framework_simplejwt.utils import datetime_from_epoch
+
+
+class BlacklistCache:
+    """
+    In-process copy of the blacklisted JTIs that have not expired yet.
+
+    At most once per SYNC_INTERVAL seconds a lookup re-reads the rows
+    blacklisted since the previous sync, minus SYNC_OVERLAP seconds: a row
+    can commit well after its id and timestamp were assigned, so a plain
+    "newer than what we saw" read could skip it for good. Everything is
+    reloaded every FULL_RELOAD_INTERVAL seconds as a backstop. Tokens
+    blacklisted by this process are added straight away.
+    """
+
+    def __init__(self):
+        self._expires = {}  # jti -> expires_at
+        self._synced_at = None  # monotonic, for the sync interval
+        self._window_start = None  # wall clock, start of the next incremental read
+        self._reloaded_at = None
+        self._lock = threading.Lock()
+
+    def sync(self, force=False):
+        with self._lock:
+            options = settings.TOKEN_BLACKLIST
+            monotonic = time.monotonic()
+            if not force and self._synced_at is not None and monotonic - self._synced_at < options['SYNC_INTERVAL']:
+                return
+            now = timezone.now()
+            rows = BlacklistedToken.objects.filter(token__expires_at__gt=now)
+            full = self._reloaded_at is None or monotonic - self._reloaded_at >= options['FULL_RELOAD_INTERVAL']
+            if full:
+                self._expires = {}
+                self._reloaded_at = monotonic
+            else:
+                rows = rows.filter(blacklisted_at__gte=self._window_start)
+            for jti, expires_at in rows.values_list('token__jti', 'token__expires_at').iterator():
+                self._expires[jti] = expires_at
+            self._expires = {jti: expires_at for jti, expires_at in self._expires.items() if expires_at > now}
+            self._window_start = now - timedelta(seconds=options['SYNC_OVERLAP'])
+            self._synced_at = monotonic
+
+    def contains(self, jti):
+        self.sync()
+        return jti in self._expires
+
+    def add(self, jti, expires_at):
+        with self._lock:
+            self._expires[jti] = expires_at
+
+    def clear(self):
+        with self._lock:
+            self._expires = {}
+            self._synced_at = None
+            self._window_start = None
+            self._reloaded_at = None
+
+
+blacklist_cache = BlacklistCache()
+
+
+class RefreshToken(BaseRefreshToken):
+    """Refresh token checking the blacklist against BlacklistCache instead of a query per use"""
+
+    def check_blacklist(self):
+        if blacklist_cache.contains(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError("Token is blacklisted")
+
+    def blacklist(self):
+        result = super().blacklist()
+        blacklist_cache.add(self.payload[api_settings.JTI_CLAIM], datetime_from_epoch(self.payload['exp']))
+        return result
+
+
+def purge_expired_tokens(batch_size=1000):
+    """
+    Delete expired outstanding tokens, and with them their blacklist
+    entries, batch_size rows at a time. Returns the number of outstanding
+    tokens deleted.
+    """
+    cutoff = timezone.now()
+    deleted = 0
+    while True:
+        ids = list(
+            OutstandingToken.objects.filter(expires_at__lte=cutoff)
+            .order_by('id').values_list('id', flat=True)[:batch_size]
+        )
+        if not ids:
+            return deleted
+        BlacklistedToken.objects.filter(token_id__in=ids).delete()
+        count, _ = OutstandingToken.objects.filter(id__in=ids).delete()
+        deleted += count
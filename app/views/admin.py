@@ -1,45 +1,146 @@
+import json
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
-from django.db.models import Count
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Count, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
 from django.utils import timezone
-from datetime import timedelta
-from app.models import User, AuditLog, Profile, Application
+from datetime import datetime, time, timedelta
+from django.utils.dateparse import parse_date
+from app.models import User, AuditLog, AuditRollupCheckpoint, Profile, Application, Job
 from app.mixins import ObjectManager, APIResponse, AuditMixin
 from app.serializers.profile import ProfileSerializer
-from app.serializers.application import ApplicationSerializer
+from app.serializers.application import ApplicationSerializer, serialize_application_values
+from app.utils.audit_rollup import count_actions, top_users
+from app.utils.fields import InvalidFields, requested_fields
+from app.utils.latency import latency_series
+from app.utils.pagination import KeysetPaginator, InvalidCursor, positive_int
+from app.utils.search import search_applications, search_ordering
+from app.utils.streaming import chunked, csv_lines, streaming_response
 
-class AdminUserManagementView(ObjectManager, AuditMixin):
+
+def start_of_day(value):
+    """Aware datetime for midnight of a YYYY-MM-DD date in the current time zone"""
+    try:
+        day = parse_date(value)
+    except ValueError:
+        day = None
+    if day is None:
+        raise ValueError(f"Invalid date '{value}', expected YYYY-MM-DD")
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+class AdminUserManagementView(AuditMixin, ObjectManager):
     """Admin API for user management"""
     permission_classes = [IsAuthenticated]
     
+    ORDERINGS = ('date_joined', '-date_joined', 'username', '-username', 'email', '-email', 'id', '-id')
+    paginator = KeysetPaginator('date_joined', descending=True, page_size=50, max_page_size=500)
+
+    def build_queryset(self, params):
+        """Filtered user queryset; raises ValueError on a malformed filter"""
+        queryset = User.objects.all()
+
+        role = params.get('role')
+        if role:
+            if role not in User.Role.values:
+                raise ValueError(f"Invalid role '{role}'")
+            queryset = queryset.filter(role=role)
+        is_active = params.get('is_active')
+        if is_active:
+            if is_active.lower() not in ('true', 'false'):
+                raise ValueError("Invalid is_active, expected 'true' or 'false'")
+            queryset = queryset.filter(is_active=is_active.lower() == 'true')
+        joined_after = params.get('joined_after')
+        if joined_after:
+            queryset = queryset.filter(date_joined__gte=start_of_day(joined_after))
+        joined_before = params.get('joined_before')
+        if joined_before:
+            queryset = queryset.filter(date_joined__lt=start_of_day(joined_before) + timedelta(days=1))
+        return queryset
+
     def get(self, request):
-        """Get all users with their profiles"""
+        """Get users with their profiles, filtered and paginated"""
         # Check if user is admin
         if not request.user.is_admin():
             return APIResponse.error("Access denied. Admin privileges required.", status.HTTP_403_FORBIDDEN)
         
-        users = User.objects.select_related('profile').all()
+        try:
+            queryset = self.build_queryset(request.GET)
+        except ValueError as e:
+            return APIResponse.error(str(e), status.HTTP_400_BAD_REQUEST)
         
-        user_data = []
-        for user in users:
-            user_info = {
-                'id': user.id,
-                'username': user.username,
-                'email': user.email,
-                'role': user.role,
-                'is_active': user.is_active,
-                'date_joined': user.date_joined,
-                'last_login': user.last_login,
-                'profile': ProfileSerializer(user.profile).data if hasattr(user, 'profile') else None,
-                'audit_logs_count': user.audit_logs.count(),
-            }
-            user_data.append(user_info)
+        # The correlated count only runs for the rows on the page
+        audit_logs_count = AuditLog.objects.filter(user=OuterRef('pk')).order_by().values('user').annotate(
+            count=Count('id')
+        ).values('count')
+        queryset = queryset.select_related('profile').annotate(
+            audit_logs_count=Coalesce(Subquery(audit_logs_count), 0)
+        )
+        
+        # Cursor pagination on (date_joined, id): ?pagination=cursor, then ?cursor=<token>
+        cursor = request.GET.get('cursor')
+        if cursor or request.GET.get('pagination') == 'cursor':
+            ordering = request.GET.get('ordering')
+            if ordering and ordering != self.paginator.ordering()[0]:
+                return APIResponse.error(
+                    f"Cursor pagination is always ordered by '{self.paginator.ordering()[0]}'; "
+                    "use page pagination for other orderings",
+                    status.HTTP_400_BAD_REQUEST,
+                )
+            page_size = self.paginator.get_page_size(request.GET.get('page_size'))
+            try:
+                users, next_cursor, prev_cursor = self.paginator.paginate(queryset, cursor, page_size)
+            except InvalidCursor as e:
+                return APIResponse.error(str(e), status.HTTP_400_BAD_REQUEST)
+            return APIResponse.success(data={
+                'users': [self.format_user(user) for user in users],
+                'pagination': {
+                    'page_size': page_size,
+                    'next_cursor': next_cursor,
+                    'prev_cursor': prev_cursor,
+                }
+            })
+        
+        # Page number pagination
+        ordering = request.GET.get('ordering', '-date_joined')
+        if ordering not in self.ORDERINGS:
+            return APIResponse.error(f"Invalid ordering '{ordering}'", status.HTTP_400_BAD_REQUEST)
+        try:
+            page = positive_int(request.GET.get('page'), 'page', 1)
+        except ValueError as e:
+            return APIResponse.error(str(e), status.HTTP_400_BAD_REQUEST)
+        page_size = self.paginator.get_page_size(request.GET.get('page_size'))
+        total = queryset.count()
+        start = (page - 1) * page_size
+        users = queryset.order_by(ordering, '-id' if ordering.startswith('-') else 'id')[start:start + page_size]
         
-        return APIResponse.success(data=user_data)
+        return APIResponse.success(data={
+            'users': [self.format_user(user) for user in users],
+            'pagination': {
+                'page': page,
+                'page_size': page_size,
+                'total': total,
+                'total_pages': (total + page_size - 1) // page_size,
+            }
+        })
+
+    @staticmethod
+    def format_user(user):
+        return {
+            'id': user.id,
+            'username': user.username,
+            'email': user.email,
+            'role': user.role,
+            'is_active': user.is_active,
+            'date_joined': user.date_joined,
+            'last_login': user.last_login,
+            'profile': ProfileSerializer(user.profile).data if hasattr(user, 'profile') else None,
+            'audit_logs_count': user.audit_logs_count,
+        }
     
     def delete(self, request, user_id):
-        """Delete a user"""
+        """Schedule a user for deletion by the job worker"""
         if not request.user.is_admin():
             return APIResponse.error("Access denied. Admin privileges required.", status.HTTP_403_FORBIDDEN)
         
@@ -52,76 +153,90 @@ class AdminUserManagementView(ObjectManager, AuditMixin):
         if user.id == request.user.id:
             return APIResponse.error("Cannot delete your own account", status.HTTP_400_BAD_REQUEST)
         
-        username = user.username
-        user.delete()
+        # Lock the account out now; the cascade runs in the job worker
+        user.is_active = False
+        user.save(update_fields=['is_active'])
+        job = Job.enqueue('delete_user', payload={'user_id': user.id}, created_by=request.user)
         
         # Log the deletion
         AuditLog.log_action(
             user=request.user,
             action=AuditLog.ActionType.USER_DELETE,
-            details={'deleted_username': username, 'deleted_user_id': user_id}
+            details={'deleted_username': user.username, 'deleted_user_id': user_id, 'job_id': job.id}
         )
         
-        return APIResponse.success(message="User deleted successfully")
+        return APIResponse.success(
+            data=job.to_dict(),
+            message="User deletion scheduled",
+            status_code=status.HTTP_202_ACCEPTED
+        )
 
-class AdminAuditLogView(ObjectManager, AuditMixin):
+class AdminAuditLogView(AuditMixin, ObjectManager):
     """Admin API for audit log monitoring"""
     permission_classes = [IsAuthenticated]
     
-    def get(self, request):
-        """Get audit logs with filtering"""
-        if not request.user.is_admin():
-            return APIResponse.error("Access denied. Admin privileges required.", status.HTTP_403_FORBIDDEN)
-        
-        # Get query parameters
-        user_id = request.GET.get('user_id')
-        action = request.GET.get('action')
-        start_date = request.GET.get('start_date')
-        end_date = request.GET.get('end_date')
-        page = int(request.GET.get('page', 1))
-        page_size = int(request.GET.get('page_size', 50))
-        
-        # Build queryset
-        queryset = AuditLog.objects.select_related('user').all()
-        
+    paginator = KeysetPaginator('timestamp', descending=True, page_size=50, max_page_size=500)
+
+    def build_queryset(self, params):
+        """Filtered audit log queryset; raises ValueError on a malformed date"""
+        user_id = params.get('user_id')
+        action = params.get('action')
+        start_date = params.get('start_date')
+        end_date = params.get('end_date')
+
+        queryset = AuditLog.objects.all()
+
         if user_id:
             queryset = queryset.filter(user_id=user_id)
         if action:
             queryset = queryset.filter(action=action)
+        # Half-open timestamp ranges keep the (user|action, timestamp) indexes usable
         if start_date:
-            queryset = queryset.filter(timestamp__date__gte=start_date)
+            queryset = queryset.filter(timestamp__gte=start_of_day(start_date))
         if end_date:
-            queryset = queryset.filter(timestamp__date__lte=end_date)
+            queryset = queryset.filter(timestamp__lt=start_of_day(end_date) + timedelta(days=1))
+        return queryset
+
+    def get(self, request):
+        """Get audit logs with filtering"""
+        if not request.user.is_admin():
+            return APIResponse.error("Access denied. Admin privileges required.", status.HTTP_403_FORBIDDEN)
+        
+        try:
+            queryset = self.build_queryset(request.GET).select_related('user')
+        except ValueError as e:
+            return APIResponse.error(str(e), status.HTTP_400_BAD_REQUEST)
         
-        # Pagination
+        # Cursor pagination: ?pagination=cursor for the first page, then ?cursor=<token>
+        cursor = request.GET.get('cursor')
+        if cursor or request.GET.get('pagination') == 'cursor':
+            page_size = self.paginator.get_page_size(request.GET.get('page_size'))
+            try:
+                logs, next_cursor, prev_cursor = self.paginator.paginate(queryset, cursor, page_size)
+            except InvalidCursor as e:
+                return APIResponse.error(str(e), status.HTTP_400_BAD_REQUEST)
+            return APIResponse.success(data={
+                'logs': [self.format_log(log) for log in logs],
+                'pagination': {
+                    'page_size': page_size,
+                    'next_cursor': next_cursor,
+                    'prev_cursor': prev_cursor,
+                }
+            })
+        
+        # Page number pagination
+        try:
+            page = positive_int(request.GET.get('page'), 'page', 1)
+            page_size = positive_int(request.GET.get('page_size'), 'page_size', 50, self.paginator.max_page_size)
+        except ValueError as e:
+            return APIResponse.error(str(e), status.HTTP_400_BAD_REQUEST)
         total = queryset.count()
         start = (page - 1) * page_size
         end = start + page_size
-        logs = queryset[start:end]
-        
-        # Format response
-        log_data = []
-        for log in logs:
-            log_info = {
-                'id': log.id,
-                'user': {
-                    'id': log.user.id,
-                    'username': log.user.username,
-                    'email': log.user.email,
-                },
-                'action': log.action,
-                'timestamp': log.timestamp,
-                'ip_address': log.ip_address,
-                'endpoint': log.endpoint,
-                'method': log.method,
-                'status_code': log.status_code,
-                'response_time': log.response_time,
-                'details': log.details,
-            }
-            log_data.append(log_info)
+        logs = queryset.order_by(*self.paginator.ordering())[start:end]
         
         return APIResponse.success(data={
-            'logs': log_data,
+            'logs': [self.format_log(log) for log in logs],
             'pagination': {
                 'page': page,
                 'page_size': page_size,
@@ -130,7 +245,71 @@ class AdminAuditLogView(ObjectManager, AuditMixin):
             }
         })
 
-class AdminDashboardView(ObjectManager, AuditMixin):
+    @staticmethod
+    def format_log(log):
+        return {
+            'id': log.id,
+            'user': {
+                'id': log.user.id,
+                'username': log.user.username,
+                'email': log.user.email,
+            },
+            'action': log.action,
+            'timestamp': log.timestamp,
+            'ip_address': log.ip_address,
+            'endpoint': log.endpoint,
+            'method': log.method,
+            'status_code': log.status_code,
+            'response_time': log.response_time,
+            'details': log.details,
+        }
+
+class AdminAuditLogExportView(AdminAuditLogView):
+    """Admin API for streaming audit log exports"""
+    EXPORT_FIELDS = (
+        'id', 'user_id', 'user__username', 'user__email', 'action', 'timestamp',
+        'ip_address', 'endpoint', 'method', 'status_code', 'response_time', 'details',
+    )
+    CHUNK_SIZE = 2000
+
+    def get(self, request):
+        """Stream audit logs as NDJSON or CSV with the same filters as the list"""
+        if not request.user.is_admin():
+            return APIResponse.error("Access denied. Admin privileges required.", status.HTTP_403_FORBIDDEN)
+        
+        # ?format= is reserved by DRF content negotiation, so the export uses ?output=
+        output = request.GET.get('output', 'ndjson')
+        if output not in ('ndjson', 'csv'):
+            return APIResponse.error("Invalid output, expected 'ndjson' or 'csv'", status.HTTP_400_BAD_REQUEST)
+        
+        try:
+            queryset = self.build_queryset(request.GET)
+        except ValueError as e:
+            return APIResponse.error(str(e), status.HTTP_400_BAD_REQUEST)
+        
+        # Chronological order, read through a server-side cursor
+        rows = queryset.order_by('timestamp', 'id').values_list(*self.EXPORT_FIELDS).iterator(
+            chunk_size=self.CHUNK_SIZE
+        )
+        filename = f"audit-logs-{timezone.now():%Y%m%d-%H%M%S}.{output}"
+        
+        if output == 'csv':
+            lines = csv_lines(self.EXPORT_FIELDS, (self.csv_row(row) for row in rows))
+            return streaming_response(request, chunked(lines), 'text/csv', filename)
+        
+        lines = (
+            json.dumps(dict(zip(self.EXPORT_FIELDS, row)), cls=DjangoJSONEncoder) + '\n'
+            for row in rows
+        )
+        return streaming_response(request, chunked(lines), 'application/x-ndjson', filename)
+
+    @staticmethod
+    def csv_row(row):
+        *values, details = row
+        values = [value.isoformat() if isinstance(value, datetime) else value for value in values]
+        return (*values, json.dumps(details, cls=DjangoJSONEncoder))
+
+class AdminDashboardView(AuditMixin, ObjectManager):
     """Admin API for dashboard analytics"""
     permission_classes = [IsAuthenticated]
     
@@ -140,34 +319,25 @@ class AdminDashboardView(ObjectManager, AuditMixin):
             return APIResponse.error("Access denied. Admin privileges required.", status.HTTP_403_FORBIDDEN)
         
         # Get date ranges
-        today = timezone.now().date()
-        week_ago = today - timedelta(days=7)
-        month_ago = today - timedelta(days=30)
+        today_start = timezone.localtime().replace(hour=0, minute=0, second=0, microsecond=0)
+        week_start = today_start - timedelta(days=7)
+        month_start = today_start - timedelta(days=30)
         
         # User statistics
-        total_users = User.objects.count()
-        active_users = User.objects.filter(is_active=True).count()
-        new_users_week = User.objects.filter(date_joined__gte=week_ago).count()
-        new_users_month = User.objects.filter(date_joined__gte=month_ago).count()
-        
-        # API usage statistics
-        api_calls_today = AuditLog.objects.filter(
-            action=AuditLog.ActionType.API_CALL,
-            timestamp__date=today
-        ).count()
-        
-        api_calls_week = AuditLog.objects.filter(
-            action=AuditLog.ActionType.API_CALL,
-            timestamp__gte=week_ago
-        ).count()
+        user_stats = User.objects.aggregate(
+            total=Count('id'),
+            active=Count('id', filter=Q(is_active=True)),
+            new_week=Count('id', filter=Q(date_joined__gte=week_start)),
+            new_month=Count('id', filter=Q(date_joined__gte=month_start)),
+        )
         
-        # Top users by activity
-        top_users = AuditLog.objects.values('user__username').annotate(
-            activity_count=Count('id')
-        ).order_by('-activity_count')[:10]
+        # API usage statistics, read from the daily rollups; one checkpoint read for all of them
+        checkpoint = AuditRollupCheckpoint.current()
+        api_calls_today = count_actions(since=today_start, action=AuditLog.ActionType.API_CALL, checkpoint=checkpoint)
+        api_calls_week = count_actions(since=week_start, action=AuditLog.ActionType.API_CALL, checkpoint=checkpoint)
         
         # Recent activity
-        recent_logs = AuditLog.objects.select_related('user').order_by('-timestamp')[:10]
+        recent_logs = AuditLog.objects.select_related('user').order_by('-timestamp', '-id')[:10]
         recent_activity = []
         for log in recent_logs:
             recent_activity.append({
@@ -178,24 +348,105 @@ class AdminDashboardView(ObjectManager, AuditMixin):
             })
         
         # Action breakdown
-        action_counts = AuditLog.objects.values('action').annotate(
-            count=Count('id')
-        ).order_by('-count')
+        action_counts = [
+            {'action': action, 'count': count}
+            for action, count in count_actions(checkpoint=checkpoint).most_common()
+        ]
         
         return APIResponse.success(data={
-            'users': {
-                'total': total_users,
-                'active': active_users,
-                'new_week': new_users_week,
-                'new_month': new_users_month,
-            },
+            'users': user_stats,
             'api_usage': {
-                'today': api_calls_today,
-                'week': api_calls_week,
+                'today': api_calls_today[AuditLog.ActionType.API_CALL],
+                'week': api_calls_week[AuditLog.ActionType.API_CALL],
             },
-            'top_users': list(top_users),
+            'top_users': top_users(limit=10, checkpoint=checkpoint),
             'recent_activity': recent_activity,
-            'action_breakdown': list(action_counts),
+            'action_breakdown': action_counts,
+        })
+
+class AdminLatencyAnalyticsView(AuditMixin, ObjectManager):
+    """Admin API for endpoint latency percentiles from audit data"""
+    permission_classes = [IsAuthenticated]
+    
+    # window -> (length, default bucket, allowed buckets)
+    WINDOWS = {
+        '1h': (timedelta(hours=1), 'minute', ('minute',)),
+        '24h': (timedelta(hours=24), 'hour', ('minute', 'hour')),
+        '7d': (timedelta(days=7), 'hour', ('hour', 'day')),
+        '30d': (timedelta(days=30), 'day', ('hour', 'day')),
+    }
+    
+    def get(self, request):
+        """Get p50/p95/p99 response times per endpoint and status class as time series"""
+        if not request.user.is_admin():
+            return APIResponse.error("Access denied. Admin privileges required.", status.HTTP_403_FORBIDDEN)
+        
+        window = request.GET.get('window', '24h')
+        if window not in self.WINDOWS:
+            return APIResponse.error(
+                f"Invalid window, expected one of {', '.join(self.WINDOWS)}", status.HTTP_400_BAD_REQUEST
+            )
+        length, default_bucket, buckets = self.WINDOWS[window]
+        bucket = request.GET.get('bucket', default_bucket)
+        if bucket not in buckets:
+            return APIResponse.error(
+                f"Invalid bucket for {window}, expected one of {', '.join(buckets)}", status.HTTP_400_BAD_REQUEST
+            )
+        
+        since = timezone.now() - length
+        stats = latency_series(
+            since, bucket,
+            endpoint=request.GET.get('endpoint'),
+            method=request.GET.get('method'),
+        )
+        return APIResponse.success(data={
+            'window': window,
+            'bucket': bucket,
+            'since': since,
+            **stats,
+        })
+
+class AdminApplicationSearchView(AuditMixin, ObjectManager):
+    """Admin API for searching applications across all users"""
+    permission_classes = [IsAuthenticated]
+    
+    def get(self, request):
+        """Search company and position over every user's applications, most relevant first"""
+        if not request.user.is_admin():
+            return APIResponse.error("Access denied. Admin privileges required.", status.HTTP_403_FORBIDDEN)
+        
+        query = request.GET.get('q', '').strip()
+        if not query:
+            return APIResponse.error("Query parameter 'q' is required", status.HTTP_400_BAD_REQUEST)
+        
+        queryset = search_applications(Application.objects.select_related('user'), query)
+        user_id = request.GET.get('user_id')
+        if user_id:
+            queryset = queryset.filter(user_id=user_id)
+        
+        # No COUNT(*) over the whole match set; fetch one extra row for has_next
+        try:
+            page = positive_int(request.GET.get('page'), 'page', 1)
+            page_size = positive_int(request.GET.get('page_size'), 'page_size', 20, 100)
+        except ValueError as e:
+            return APIResponse.error(str(e), status.HTTP_400_BAD_REQUEST)
+        start = (page - 1) * page_size
+        applications = list(queryset.order_by(*search_ordering('-applied_date', '-id'))[start:start + page_size + 1])
+        
+        return APIResponse.success(data={
+            'results': [
+                {
+                    **ApplicationSerializer(application).data,
+                    'user': {'id': application.user.id, 'email': application.user.email},
+                    'rank': application.search_rank,
+                }
+                for application in applications[:page_size]
+            ],
+            'pagination': {
+                'page': page,
+                'page_size': page_size,
+                'has_next': len(applications) > page_size,
+            }
         })
 
 # URL patterns for admin views
@@ -220,6 +471,13 @@ def admin_audit_logs(request):
     view = AdminAuditLogView()
     return view.get(request)
 
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def admin_audit_logs_export(request):
+    """Stream an audit log export"""
+    view = AdminAuditLogExportView()
+    return view.get(request)
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def admin_dashboard(request):
@@ -227,6 +485,32 @@ def admin_dashboard(request):
     view = AdminDashboardView()
     return view.get(request)
 
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def admin_job_detail(request, job_id):
+    """Admin: Get the status and progress of a background job"""
+    if not request.user.is_admin():
+        return APIResponse.error("Access denied. Admin privileges required.", status.HTTP_403_FORBIDDEN)
+    try:
+        job = Job.objects.get(id=job_id)
+        return APIResponse.success(data=job.to_dict())
+    except Job.DoesNotExist:
+        return APIResponse.error("Job not found", status.HTTP_404_NOT_FOUND)
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def admin_application_search(request):
+    """Search applications across users"""
+    view = AdminApplicationSearchView()
+    return view.get(request)
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def admin_latency_analytics(request):
+    """Get endpoint latency analytics"""
+    view = AdminLatencyAnalyticsView()
+    return view.get(request)
+
 # --- NEW ADMIN ENDPOINTS ---
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
@@ -235,8 +519,11 @@ def admin_user_profile(request, user_id):
     if not request.user.is_admin():
         return APIResponse.error("Access denied. Admin privileges required.", status.HTTP_403_FORBIDDEN)
     try:
-        profile = Profile.objects.get(user_id=user_id)
-        return APIResponse.success(data=ProfileSerializer(profile).data)
+        fields = requested_fields(request, ProfileSerializer)
+        profile = ProfileSerializer.project(Profile.objects.all(), fields).get(user_id=user_id)
+        return APIResponse.success(data=ProfileSerializer(profile, fields=fields).data)
+    except InvalidFields as e:
+        return APIResponse.error(str(e), status.HTTP_400_BAD_REQUEST)
     except Profile.DoesNotExist:
         return APIResponse.error("Profile not found", status.HTTP_404_NOT_FOUND)
 
@@ -246,8 +533,13 @@ def admin_user_applications(request, user_id):
     """Admin: Get all applications for a user"""
     if not request.user.is_admin():
         return APIResponse.error("Access denied. Admin privileges required.", status.HTTP_403_FORBIDDEN)
-    applications = Application.objects.filter(user_id=user_id)
-    data = ApplicationSerializer(applications, many=True).data
+    try:
+        fields = requested_fields(request, ApplicationSerializer)
+    except InvalidFields as e:
+        return APIResponse.error(str(e), status.HTTP_400_BAD_REQUEST)
+    applications = Application.objects.filter(user_id=user_id).order_by('-applied_date', '-id')
+    rows = applications.values(*ApplicationSerializer.columns(fields)).iterator(chunk_size=2000)
+    data = serialize_application_values(rows, fields)
     return APIResponse.success(data=data)
 
 @api_view(['GET'])
@@ -257,7 +549,10 @@ def admin_application_detail(request, application_id):
     if not request.user.is_admin():
         return APIResponse.error("Access denied. Admin privileges required.", status.HTTP_403_FORBIDDEN)
     try:
-        application = Application.objects.get(id=application_id)
-        return APIResponse.success(data=ApplicationSerializer(application).data)
+        fields = requested_fields(request, ApplicationSerializer)
+        application = ApplicationSerializer.project(Application.objects.all(), fields).get(id=application_id)
+        return APIResponse.success(data=ApplicationSerializer(application, fields=fields).data)
+    except InvalidFields as e:
+        return APIResponse.error(str(e), status.HTTP_400_BAD_REQUEST)
     except Application.DoesNotExist:
         return APIResponse.error("Application not found", status.HTTP_404_NOT_FOUND) 
\ No newline at end of file
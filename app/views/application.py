@@ -1,38 +1,61 @@
+import uuid
 from rest_framework import status
+from rest_framework.parsers import MultiPartParser
 from rest_framework.permissions import IsAuthenticated
+from django.conf import settings
+from django.db import transaction
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
 from datetime import date
-from collections import Counter
-from django.db.models import Avg
-from ..utils.pagination import CustomPageNumberPagination
+from ..utils.application_summary import deferred_summaries, get_summary, mark_stale
+from ..utils.changes import UPSERT, ExpiredCursor, application_changes, deferred_tombstones
+from ..utils.fields import InvalidFields, requested_fields
+from ..utils.imports import InvalidImport, detect_format, import_applications, import_storage, read_rows
+from ..utils.pagination import CustomPageNumberPagination, InvalidCursor, KeysetPaginator, positive_int
+from ..utils.search import search_applications, search_ordering
 
-from ..models import Application
+from ..models import Application, Job, UserApplicationSummary
 from ..serializers import ApplicationSerializer, ApplicationCreateUpdateSerializer, ApplicationStatsSerializer, ApplicationAnalyticsSerializer
-from ..mixins import ObjectManager, APIResponse
+from ..serializers.application import serialize_application_values
+from ..mixins import ObjectManager, APIResponse, conditional_get
 from ..mixins.audit import AuditMixin
 
 
-class ApplicationAPIView(ObjectManager, AuditMixin):
+class ApplicationAPIView(AuditMixin, ObjectManager):
     permission_classes = [IsAuthenticated]
+    # Reads stay unthrottled
+    throttle_scope = {'POST': 'application_write', 'PUT': 'application_write', 'DELETE': 'application_write'}
+    paginator = KeysetPaginator(
+        'applied_date',
+        descending=True,
+        page_size=CustomPageNumberPagination.page_size,
+        max_page_size=CustomPageNumberPagination.max_page_size,
+    )
     
+    @conditional_get()
     def get(self, request, application_id=None):
         """GET /applications/ - List all applications with pagination and search
            GET /applications/{id}/ - Get specific application"""
         try:
+            # Sparse fieldsets: ?fields=id,company,status
+            fields = requested_fields(request, ApplicationSerializer)
             if application_id:
                 # Get specific application
-                application = get_object_or_404(Application, id=application_id, user=request.user)
-                serializer = ApplicationSerializer(application)
+                application = get_object_or_404(
+                    ApplicationSerializer.project(Application.objects.all(), fields),
+                    id=application_id, user=request.user,
+                )
+                serializer = ApplicationSerializer(application, fields=fields)
                 return APIResponse.success(data=serializer.data)
             else:
                 # Get all applications for user, with search and pagination
                 applications = Application.objects.filter(user=request.user)
-                search_query = request.GET.get('search')
+                # Cursors are built from applied_date and id, so those are always read
+                columns = dict.fromkeys(['id', 'applied_date', *ApplicationSerializer.columns(fields)])
+                search_query = request.GET.get('search', '').strip()
                 if search_query:
-                    from django.db.models import Q
-                    applications = applications.filter(
-                        Q(company__icontains=search_query)
-                    )
+                    # Matches company or position; pages rank by relevance, cursors keep date order
+                    applications = search_applications(applications, search_query)
                 # Date range filtering
                 applied_date_after = request.GET.get('applied_date_after')
                 applied_date_before = request.GET.get('applied_date_before')
@@ -41,12 +64,54 @@ class ApplicationAPIView(ObjectManager, AuditMixin):
                 if applied_date_before:
                     applications = applications.filter(applied_date__lte=applied_date_before)
                     
+                # Cursor pagination on (applied_date, id): ?pagination=cursor, then ?cursor=<token>
+                cursor = request.GET.get('cursor')
+                if cursor or request.GET.get('pagination') == 'cursor':
+                    page_size = self.paginator.get_page_size(request.GET.get('page_size'))
+                    try:
+                        page, next_cursor, prev_cursor = self.paginator.paginate(
+                            applications.values(*columns), cursor, page_size
+                        )
+                    except InvalidCursor as e:
+                        return APIResponse.error(str(e), status.HTTP_400_BAD_REQUEST)
+                    return APIResponse.success(data={
+                        'results': serialize_application_values(page, fields),
+                        'pagination': {
+                            'page_size': page_size,
+                            'next_cursor': next_cursor,
+                            'prev_cursor': prev_cursor,
+                        }
+                    })
+
+                ordering = self.paginator.ordering()
+                if search_query:
+                    ordering = search_ordering(*ordering)
+                # Rows are serialized straight from values(), skipping model instances
+                applications = applications.order_by(*ordering).values(*columns)
+
+                # Page number pagination without the COUNT(*): ?include_total=false
+                if request.GET.get('include_total') == 'false':
+                    try:
+                        page_number = positive_int(request.GET.get('page'), 'page', 1)
+                    except ValueError as e:
+                        return APIResponse.error(str(e), status.HTTP_400_BAD_REQUEST)
+                    page_size = self.paginator.get_page_size(request.GET.get('page_size'))
+                    start = (page_number - 1) * page_size
+                    page = list(applications[start:start + page_size + 1])
+                    return APIResponse.success(data={
+                        'results': serialize_application_values(page[:page_size], fields),
+                        'pagination': {
+                            'page': page_number,
+                            'page_size': page_size,
+                            'has_next': len(page) > page_size,
+                        }
+                    })
+
                 # Pagination
                 paginator = CustomPageNumberPagination()
                 page = paginator.paginate_queryset(applications, request)
-                serializer = ApplicationSerializer(page, many=True)
                 return APIResponse.success(data={
-                    'results': serializer.data,
+                    'results': serialize_application_values(page, fields),
                     'pagination': {
                         'page': paginator.page.number,
                         'page_size': paginator.page.paginator.per_page,
@@ -54,6 +119,8 @@ class ApplicationAPIView(ObjectManager, AuditMixin):
                         'total_pages': paginator.page.paginator.num_pages,
                     }
                 })
+        except InvalidFields as e:
+            return APIResponse.error(str(e), status.HTTP_400_BAD_REQUEST)
         except Exception as e:
             return APIResponse.error(message="Failed to fetch applications")
     
@@ -106,76 +173,307 @@ class ApplicationAPIView(ObjectManager, AuditMixin):
             return APIResponse.error(message="Failed to delete application")
         
 
-class ApplicationStatsAPIView(ObjectManager, AuditMixin):
+class ApplicationBulkAPIView(AuditMixin, ObjectManager):
+    """
+    Batch create, update and delete of the user's applications.
+
+    Every item is validated before anything is written, and the writes run
+    in a single transaction: a batch either applies in full or not at all.
+    """
+    permission_classes = [IsAuthenticated]
+    throttle_scope = {'POST': 'application_write', 'PATCH': 'application_write', 'DELETE': 'application_write'}
+
+    def get_items(self, request, key):
+        """Return (items, None) or (None, error response) for the request's item list"""
+        items = request.data.get(key) if isinstance(request.data, dict) else None
+        if not isinstance(items, list) or not items:
+            return None, APIResponse.error(f"'{key}' must be a non-empty list")
+        max_items = settings.APPLICATION_BULK_MAX_ITEMS
+        if len(items) > max_items:
+            return None, APIResponse.error(f"At most {max_items} items are allowed per request")
+        return items, None
+
+    @staticmethod
+    def is_id(value):
+        # JSON true/false would otherwise pass as ids 1 and 0
+        return isinstance(value, int) and not isinstance(value, bool)
+
+    @staticmethod
+    def item_errors(errors):
+        return APIResponse.error(message="Validation error", errors={'items': errors})
+
+    def post(self, request):
+        """POST /applications/bulk/ - Create applications from {"items": [...]}"""
+        items, error = self.get_items(request, 'items')
+        if error:
+            return error
+
+        serializer = ApplicationCreateUpdateSerializer(data=items, many=True, context={'request': request})
+        if not serializer.is_valid():
+            return self.item_errors([
+                {'index': index, 'errors': errors}
+                for index, errors in enumerate(serializer.errors) if errors
+            ])
+
+        applications = [Application(user=request.user, **data) for data in serializer.validated_data]
+        with transaction.atomic(), deferred_summaries():
+            Application.objects.bulk_create(applications)
+            mark_stale([request.user.pk])
+
+        return APIResponse.success(data={
+            'results': [
+                {'index': index, 'result': 'created', **ApplicationSerializer(application).data}
+                for index, application in enumerate(applications)
+            ]
+        }, status_code=status.HTTP_201_CREATED)
+
+    def patch(self, request):
+        """PATCH /applications/bulk/ - Partially update applications from {"items": [{"id": ..., ...}]}"""
+        items, error = self.get_items(request, 'items')
+        if error:
+            return error
+
+        ids = [item.get('id') if isinstance(item, dict) else None for item in items]
+        valid_ids = [pk for pk in ids if self.is_id(pk)]
+        existing = Application.objects.filter(user=request.user, id__in=valid_ids).in_bulk()
+
+        errors, valid = [], []
+        for index, (pk, item) in enumerate(zip(ids, items)):
+            application = existing.get(pk) if self.is_id(pk) else None
+            if application is None:
+                errors.append({'index': index, 'errors': {'id': ['Application not found']}})
+                continue
+            serializer = ApplicationCreateUpdateSerializer(
+                application, data=item, partial=True, context={'request': request}
+            )
+            if not serializer.is_valid():
+                errors.append({'index': index, 'errors': serializer.errors})
+                continue
+            valid.append(serializer)
+        if len(set(valid_ids)) != len(valid_ids):
+            errors.append({'index': None, 'errors': {'id': ['Each application may appear only once']}})
+        if errors:
+            return self.item_errors(errors)
+
+        fields = {'updated_at'}  # bulk_update skips auto_now
+        now = timezone.now()
+        for serializer in valid:
+            serializer.instance.updated_at = now
+            for field, value in serializer.validated_data.items():
+                setattr(serializer.instance, field, value)
+                fields.add(field)
+        applications = [serializer.instance for serializer in valid]
+        if applications:
+            with transaction.atomic(), deferred_summaries():
+                Application.objects.bulk_update(applications, sorted(fields))
+                mark_stale([request.user.pk])
+
+        return APIResponse.success(data={
+            'results': [
+                {'index': index, 'result': 'updated', **ApplicationSerializer(application).data}
+                for index, application in enumerate(applications)
+            ]
+        })
+
+    def delete(self, request):
+        """DELETE /applications/bulk/ - Delete applications from {"ids": [...]}"""
+        ids, error = self.get_items(request, 'ids')
+        if error:
+            return error
+        if not all(self.is_id(pk) for pk in ids):
+            return APIResponse.error("'ids' must be a list of integers")
+
+        with transaction.atomic(), deferred_summaries(), deferred_tombstones():
+            applications = Application.objects.filter(user=request.user, id__in=ids)
+            deleted = set(applications.values_list('id', flat=True))
+            applications.delete()
+
+        return APIResponse.success(data={
+            'results': [
+                {'index': index, 'id': pk, 'result': 'deleted' if pk in deleted else 'not_found'}
+                for index, pk in enumerate(ids)
+            ]
+        })
+
+
+class ApplicationImportAPIView(AuditMixin, ObjectManager):
+    """
+    CSV/NDJSON import of applications.
+
+    Small uploads are imported during the request. Larger ones are stored
+    and handed to the job worker; the response points at a status resource
+    to poll.
+    """
     permission_classes = [IsAuthenticated]
+    parser_classes = [MultiPartParser]
+    throttle_scope = {'POST': 'application_write'}
+
+    def get(self, request, job_id=None):
+        """GET /applications/import/{job_id}/ - Status of a background import"""
+        if job_id is None:
+            # GET /applications/import/ has nothing to list
+            return self.http_method_not_allowed(request)
+        job = Job.objects.filter(id=job_id, kind='import_applications', created_by=request.user).first()
+        if job is None:
+            return APIResponse.error("Import not found", status.HTTP_404_NOT_FOUND)
+        return APIResponse.success(data=self.format_job(job))
 
+    @staticmethod
+    def format_job(job):
+        """Import status for its owner; the worker's traceback stays in the admin job view"""
+        data = {
+            'id': job.id,
+            'status': job.status,
+            'progress': job.progress,
+            'result': job.result if job.status == Job.Status.SUCCEEDED else None,
+            'created_at': job.created_at,
+            'started_at': job.started_at,
+            'finished_at': job.finished_at,
+        }
+        if job.status == Job.Status.FAILED:
+            data['message'] = (job.result or {}).get('error') or 'The import failed; please try again.'
+        elif job.status == Job.Status.PENDING and job.attempts:
+            data['message'] = 'The import hit an error and will be retried.'
+        return data
+
+    def post(self, request):
+        """POST /applications/import/ - Import a CSV or NDJSON file sent as 'file'"""
+        options = settings.APPLICATION_IMPORT
+        upload = request.FILES.get('file')
+        if upload is None:
+            return APIResponse.error("A 'file' upload is required")
+        if upload.size > options['MAX_BYTES']:
+            return APIResponse.error(
+                f"File exceeds the {options['MAX_BYTES']} byte limit", status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+            )
+        try:
+            file_format = detect_format(upload.name, request.data.get('type'))
+        except InvalidImport as e:
+            return APIResponse.error(str(e))
+
+        if upload.size <= options['SYNC_MAX_BYTES']:
+            try:
+                totals = import_applications(request.user, read_rows(upload, file_format))
+            except InvalidImport as e:
+                return APIResponse.error(str(e))
+            return APIResponse.success(data=totals)
+
+        path = import_storage().save(f'{uuid.uuid4().hex}.{file_format}', upload)
+        job = Job.enqueue(
+            'import_applications',
+            payload={'user_id': request.user.id, 'path': path, 'format': file_format},
+            created_by=request.user,
+        )
+        return APIResponse.success(
+            data=self.format_job(job),
+            message=f"Import queued; poll /api/applications/import/{job.id}/ for progress",
+            status_code=status.HTTP_202_ACCEPTED,
+        )
+
+
+class ApplicationChangesAPIView(AuditMixin, ObjectManager):
+    """Delta sync of the user's applications"""
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        """GET /applications/changes/?since=<cursor> - Applications changed or deleted since the cursor"""
+        options = settings.APPLICATION_CHANGES
+        try:
+            limit = max(1, min(int(request.GET.get('limit', options['PAGE_SIZE'])), options['MAX_PAGE_SIZE']))
+        except ValueError:
+            return APIResponse.error("'limit' must be an integer")
+        try:
+            changes, cursor, has_more = application_changes(request.user, request.GET.get('since'), limit)
+        except InvalidCursor as e:
+            return APIResponse.error(str(e))
+        except ExpiredCursor as e:
+            return APIResponse.error(str(e), status.HTTP_410_GONE)
+
+        return APIResponse.success(data={
+            'changes': [
+                {'type': 'upsert', 'application': ApplicationSerializer(row).data} if kind == UPSERT
+                else {'type': 'delete', 'id': row.application_id}
+                for kind, row in changes
+            ],
+            'cursor': cursor,
+            'has_more': has_more,
+        })
+
+
+class ApplicationStatsAPIView(AuditMixin, ObjectManager):
+    permission_classes = [IsAuthenticated]
+
+    UPCOMING_INTERVIEWS_LIMIT = 10
+
+    # Upcoming interviews also change as days pass
+    @conditional_get(extra=lambda request: date.today().isoformat())
     def get(self, request):
         user = request.user
-        applications = Application.objects.filter(user=user)
-        total = applications.count()
-        interviews = applications.filter(status=Application.Status.INTERVIEW).count()
-        accepted = applications.filter(status=Application.Status.ACCEPTED).count()
-        rejected = applications.filter(status=Application.Status.REJECTED).count()
-        # Upcoming interviews: status=INTERVIEW and interview_date >= today
+        summary = get_summary(user)
+        counts = summary.status_counts
+        # Upcoming interviews: status=INTERVIEW and interview_date >= today,
+        # served from the (user, status, interview_date) index
         today = date.today()
-        upcoming_qs = applications.filter(status=Application.Status.INTERVIEW, interview_date__gte=today).order_by('interview_date')
+        upcoming_qs = []
+        if summary.next_interview_date is not None:
+            upcoming_qs = list(Application.objects.filter(
+                user=user, status=Application.Status.INTERVIEW, interview_date__gte=today
+            ).order_by('interview_date').values('company', 'position', 'interview_date')[:self.UPCOMING_INTERVIEWS_LIMIT])
+            if summary.next_interview_date < today:
+                # The stored date has passed; move it on to the next one
+                summary.next_interview_date = upcoming_qs[0]['interview_date'] if upcoming_qs else None
+                UserApplicationSummary.objects.filter(pk=summary.pk).update(next_interview_date=summary.next_interview_date)
         upcoming = [
             {
-                'company': app.company,
-                'position': app.position,
-                'interview_date': app.interview_date.strftime('%Y-%m-%d') if app.interview_date else None
+                'company': app['company'],
+                'position': app['position'],
+                'interview_date': app['interview_date'].strftime('%Y-%m-%d') if app['interview_date'] else None
             }
             for app in upcoming_qs
         ]
         data = {
-            'total_applications': total,
-            'interviews_scheduled': interviews,
-            'accepted_applications': accepted,
-            'rejected_applications': rejected,
+            'total_applications': summary.total,
+            'interviews_scheduled': counts.get(Application.Status.INTERVIEW, 0),
+            'accepted_applications': counts.get(Application.Status.ACCEPTED, 0),
+            'rejected_applications': counts.get(Application.Status.REJECTED, 0),
             'upcoming_interviews': upcoming,
         }
         serializer = ApplicationStatsSerializer(data)
         return APIResponse.success(data=serializer.data)     
 
 
-class ApplicationAnalyticsAPIView(ObjectManager, AuditMixin):
+class ApplicationAnalyticsAPIView(AuditMixin, ObjectManager):
     permission_classes = [IsAuthenticated]
 
+    @conditional_get()
     def get(self, request):
         """GET /applications/analytics/ - Analytics for applications"""
         user = request.user
-        applications = Application.objects.filter(user=user)
-        total = applications.count() or 1  # avoid division by zero
-
-        # Get all possible choices from the model
-        status_choices = [choice[0] for choice in Application.Status.choices]
-        job_type_choices = [choice[0] for choice in Application.JobType.choices]
+        summary = get_summary(user)
+        total = summary.total or 1  # avoid division by zero
 
-        # Status counts and percentages
-        status_counter = Counter(applications.values_list('status', flat=True))
+        # Status and job type counts and percentages
         status_counts = {
             status: {
-                "count": status_counter.get(status, 0),
-                "percent": round(100 * status_counter.get(status, 0) / total, 2)
+                "count": summary.status_counts.get(status, 0),
+                "percent": round(100 * summary.status_counts.get(status, 0) / total, 2)
             }
-            for status in status_choices
+            for status in Application.Status.values
         }
-
-        # Job type counts and percentages
-        job_type_counter = Counter(applications.values_list('job_type', flat=True))
         job_type_counts = {
             job_type: {
-                "count": job_type_counter.get(job_type, 0),
-                "percent": round(100 * job_type_counter.get(job_type, 0) / total, 2)
+                "count": summary.job_type_counts.get(job_type, 0),
+                "percent": round(100 * summary.job_type_counts.get(job_type, 0) / total, 2)
             }
-            for job_type in job_type_choices
+            for job_type in Application.JobType.values
         }
 
         # Average salary by job type
         avg_salary_by_job_type = {}
-        for job_type in job_type_choices:
-            avg_salary = applications.filter(job_type=job_type, salary__isnull=False).aggregate(avg=Avg('salary'))['avg']
-            avg_salary_by_job_type[job_type] = round(avg_salary or 0, 2)
+        for job_type in Application.JobType.values:
+            salary_count = summary.salary_counts.get(job_type, 0)
+            avg_salary = summary.salary_sums.get(job_type, 0) / salary_count if salary_count else 0
+            avg_salary_by_job_type[job_type] = round(avg_salary, 2)
 
         data = {
             "status_counts": status_counts,
@@ -1,22 +1,29 @@
 from rest_framework import status
 from rest_framework.permissions import AllowAny, IsAuthenticated
-from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
 from django.contrib.auth import authenticate
 from ..models import User
 from ..serializers import UserSerializer, UserCreateSerializer
 from ..mixins import ObjectManager, APIResponse, AuditMixin
+from ..utils.fields import InvalidFields, requested_fields
+from ..utils.token_blacklist import RefreshToken
 from rest_framework_simplejwt.views import TokenRefreshView
-from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-class AuthenticationAPIView(ObjectManager, AuditMixin):
+class AuthenticationAPIView(AuditMixin, ObjectManager):
     """Base class for authentication related views"""
     permission_classes = [AllowAny]
 
 class RegisterAPIView(AuthenticationAPIView):
+    throttle_scope = 'register'
+
     def post(self, request):
+        try:
+            fields = requested_fields(request, UserSerializer)
+        except InvalidFields as e:
+            return APIResponse.error(str(e), status.HTTP_400_BAD_REQUEST)
         serializer_result = self.validate_serializer(UserCreateSerializer, request.data)
         
         if isinstance(serializer_result, UserCreateSerializer):
@@ -41,7 +48,7 @@ class RegisterAPIView(AuthenticationAPIView):
             ]
             return APIResponse.success(
                 data={
-                    'user': UserSerializer(user).data,
+                    'user': UserSerializer(user, fields=fields).data,
                 },
                 status_code=status.HTTP_201_CREATED,
                 cookies=cookies
@@ -51,7 +58,13 @@ class RegisterAPIView(AuthenticationAPIView):
             return serializer_result
 
 class LoginAPIView(AuthenticationAPIView):
+    throttle_scope = 'login'
+
     def post(self, request):
+        try:
+            fields = requested_fields(request, UserSerializer)
+        except InvalidFields as e:
+            return APIResponse.error(str(e), status.HTTP_400_BAD_REQUEST)
         email = request.data.get('email')
         password = request.data.get('password')
 
@@ -89,14 +102,14 @@ class LoginAPIView(AuthenticationAPIView):
         ]
         return APIResponse.success(
             data={
-                'user': UserSerializer(user).data,
+                'user': UserSerializer(user, fields=fields).data,
             },
             status_code=status.HTTP_200_OK,
             cookies=cookies
         )
 
 
-class LogoutAPIView(ObjectManager, AuditMixin):
+class LogoutAPIView(AuditMixin, ObjectManager):
     permission_classes = [IsAuthenticated]
     
     def post(self, request):
@@ -166,7 +179,7 @@ class CookieTokenRefreshView(TokenRefreshView):
                 cookies=cookies,
                 status_code=status.HTTP_200_OK
             )
-        except InvalidToken:
+        except (InvalidToken, TokenError):
             return APIResponse.error(
                 message="Invalid token",
                 status_code=status.HTTP_401_UNAUTHORIZED
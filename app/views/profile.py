@@ -2,19 +2,27 @@ from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from ..models import Profile
 from ..serializers import ProfileSerializer, ProfileCreateUpdateSerializer
-from ..mixins import ObjectManager, APIResponse
+from ..utils.fields import InvalidFields, requested_fields
+from ..mixins import ObjectManager, APIResponse, conditional_get
 from ..mixins.audit import AuditMixin
 
-class ProfileAPIView(ObjectManager, AuditMixin):
+class ProfileAPIView(AuditMixin, ObjectManager):
     """Profile API View - handles all profile CRUD operations"""
     permission_classes = [IsAuthenticated]
     
+    @conditional_get()
     def get(self, request):
         """GET /profile/ - Get user's profile"""
         try:
-            profile = request.user.profile
-            serializer = ProfileSerializer(profile)
+            fields = requested_fields(request, ProfileSerializer)
+            if fields is None:
+                profile = request.user.profile
+            else:
+                profile = ProfileSerializer.project(Profile.objects.all(), fields).get(user=request.user)
+            serializer = ProfileSerializer(profile, fields=fields)
             return APIResponse.success(data=serializer.data)
+        except InvalidFields as e:
+            return APIResponse.error(str(e), status.HTTP_400_BAD_REQUEST)
         except Profile.DoesNotExist:
             return APIResponse.error(
                 message="Profile not found. Please create a profile first.",
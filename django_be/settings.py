@@ -52,7 +52,7 @@ INSTALLED_APPS = [
     'rest_framework_simplejwt.token_blacklist',
     'corsheaders',
     # Local apps
-    'app',
+    'app.apps.base.AppConfig',
 ]
 
 MIDDLEWARE = [
@@ -122,6 +122,15 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Django's default hashers, with PBKDF2 running on the bounded hashing pool
+PASSWORD_HASHERS = [
+    'app.utils.hashing.PooledPBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/5.2/topics/i18n/
@@ -170,6 +179,15 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
+    # Only views with a `throttle_scope` are throttled; see THROTTLING below
+    'DEFAULT_THROTTLE_CLASSES': [
+        'app.utils.throttling.TokenBucketThrottle',
+    ],
+    'DEFAULT_THROTTLE_RATES': {
+        'login': os.getenv('THROTTLE_RATE_LOGIN', '10/min'),
+        'register': os.getenv('THROTTLE_RATE_REGISTER', '5/hour'),
+        'application_write': os.getenv('THROTTLE_RATE_APPLICATION_WRITE', '120/min'),
+    },
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 10,
     'DEFAULT_SCHEMA_CLASS': 'rest_framework.schemas.coreapi.AutoSchema',
@@ -189,7 +207,119 @@ SIMPLE_JWT = {
     'USER_ID_CLAIM': 'user_id',
     'AUTH_TOKEN_CLASSES': (
         'rest_framework_simplejwt.tokens.AccessToken',
-        'rest_framework_simplejwt.tokens.RefreshToken',
+        'app.utils.token_blacklist.RefreshToken',
     ),
     'TOKEN_TYPE_CLAIM': 'token_type',
 }
+
+# Client addresses
+# Number of proxies in front of the app that append to X-Forwarded-For. Audit
+# logs and throttling use the address the outermost one saw; with 0 they use
+# REMOTE_ADDR. Entries further left are client-supplied and never trusted.
+TRUSTED_PROXIES = int(os.getenv('TRUSTED_PROXIES', 0))
+
+# Audit log buffering
+# Audit records are queued in-process and written in batches by a background
+# thread. Set AUDIT_LOG_BUFFER_ENABLED=False to write them synchronously (tests).
+AUDIT_LOG_BUFFER = {
+    'ENABLED': os.getenv('AUDIT_LOG_BUFFER_ENABLED', 'True') == 'True',
+    'MAX_QUEUE_SIZE': int(os.getenv('AUDIT_LOG_BUFFER_MAX_QUEUE_SIZE', 10000)),
+    'BATCH_SIZE': 500,
+    'FLUSH_INTERVAL': 2.0,  # seconds
+    'SHUTDOWN_TIMEOUT': 5.0,  # seconds
+}
+
+# Audit policies
+# First matching rule wins; `endpoint` is a path prefix and `methods` is optional.
+# Modes: always, sample (with `rate`), errors, slow (with `threshold` in seconds), never.
+# LOGIN/LOGOUT and other security actions are always logged. Views can override
+# these with an `audit_policy` attribute.
+AUDIT_DEFAULT_POLICY = {'mode': 'always'}
+AUDIT_POLICIES = [
+    {'endpoint': '/api/applications/stats/', 'methods': ['GET'], 'mode': 'sample', 'rate': 0.1},
+    {'endpoint': '/api/applications/analytics/', 'methods': ['GET'], 'mode': 'sample', 'rate': 0.1},
+]
+
+# Bulk application API
+# Maximum number of items accepted by one /api/applications/bulk/ request.
+APPLICATION_BULK_MAX_ITEMS = int(os.getenv('APPLICATION_BULK_MAX_ITEMS', 500))
+
+# Application imports
+# Uploads up to SYNC_MAX_BYTES are imported during the request; larger ones are
+# stored in UPLOAD_DIR and imported by the job worker (manage.py run_jobs).
+# UPLOAD_DIR must be storage the web and worker processes share (a common disk
+# or volume) when the worker runs on another host or container.
+APPLICATION_IMPORT = {
+    'SYNC_MAX_BYTES': int(os.getenv('APPLICATION_IMPORT_SYNC_MAX_BYTES', 256 * 1024)),
+    'MAX_BYTES': int(os.getenv('APPLICATION_IMPORT_MAX_BYTES', 50 * 1024 * 1024)),
+    'CHUNK_SIZE': 500,
+    'MAX_REPORTED_ERRORS': 100,
+    'UPLOAD_DIR': os.getenv('APPLICATION_IMPORT_UPLOAD_DIR', BASE_DIR / 'app/imports'),
+}
+
+# Application delta sync (/api/applications/changes/)
+# Writes younger than SETTLE_SECONDS are held back for the next poll; cursors older
+# than TOMBSTONE_RETENTION_DAYS (see manage.py prune_tombstones) must fully resync.
+APPLICATION_CHANGES = {
+    'SETTLE_SECONDS': 2,
+    'TOMBSTONE_RETENTION_DAYS': int(os.getenv('APPLICATION_TOMBSTONE_RETENTION_DAYS', 90)),
+    'PAGE_SIZE': 100,
+    'MAX_PAGE_SIZE': 500,
+}
+
+# Authentication caches
+# Validated access tokens are kept in a per-process LRU until they expire, so
+# repeat requests skip JWT decoding and signature checks. Authenticated users are
+# cached for USER_TTL seconds and dropped when a User is saved or deleted.
+# By default that cache is per process and the drop only reaches the process that
+# saved the user: with several workers, a deactivated user, a demoted admin or a
+# password change can go unnoticed by the others for up to USER_TTL seconds. Set
+# USER_CACHE_ALIAS to a CACHES alias shared between processes (e.g. Redis or
+# Memcached) to close that window, or lower USER_TTL.
+AUTH_CACHE = {
+    'TOKEN_MAX_ENTRIES': int(os.getenv('AUTH_TOKEN_CACHE_MAX_ENTRIES', 10000)),
+    'USER_MAX_ENTRIES': int(os.getenv('AUTH_USER_CACHE_MAX_ENTRIES', 10000)),
+    'USER_TTL': int(os.getenv('AUTH_USER_CACHE_TTL', 60)),  # seconds
+    'USER_CACHE_ALIAS': os.getenv('AUTH_USER_CACHE_ALIAS') or None,
+}
+
+# Refresh token blacklist
+# Blacklisted JTIs are checked against an in-process copy that picks up other
+# processes' logouts within SYNC_INTERVAL seconds. Each sync re-reads entries from
+# the last SYNC_OVERLAP seconds, covering late commits and clock skew between
+# servers, and the copy is rebuilt every FULL_RELOAD_INTERVAL seconds. Run
+# manage.py purge_tokens periodically to delete expired outstanding and blacklisted tokens.
+TOKEN_BLACKLIST = {
+    'SYNC_INTERVAL': float(os.getenv('TOKEN_BLACKLIST_SYNC_INTERVAL', 5)),  # seconds
+    'SYNC_OVERLAP': 60,  # seconds
+    'FULL_RELOAD_INTERVAL': 600,  # seconds
+    'PURGE_BATCH_SIZE': 1000,
+}
+
+# Password hashing pool
+# Login and registration hash on MAX_WORKERS threads per process; up to MAX_QUEUE
+# more requests wait (at most QUEUE_TIMEOUT seconds) and the rest get a 503 with
+# Retry-After: RETRY_AFTER. Every waiting request holds a server thread, so keep
+# MAX_WORKERS + MAX_QUEUE well below the worker's sync thread limit and the timeout
+# short; otherwise a login burst starves unrelated requests of threads.
+# Measure with manage.py benchmark_login.
+_hashing_workers = int(os.getenv('PASSWORD_HASHING_MAX_WORKERS', min(4, os.cpu_count() or 1)))
+PASSWORD_HASHING = {
+    'ENABLED': os.getenv('PASSWORD_HASHING_POOL_ENABLED', 'True') == 'True',
+    'MAX_WORKERS': _hashing_workers,
+    'MAX_QUEUE': int(os.getenv('PASSWORD_HASHING_MAX_QUEUE', _hashing_workers)),
+    'QUEUE_TIMEOUT': float(os.getenv('PASSWORD_HASHING_QUEUE_TIMEOUT', 2.0)),  # seconds
+    'RETRY_AFTER': 2,  # seconds
+}
+
+# Request throttling
+# Token buckets per user (or client IP when anonymous) for the rates in
+# REST_FRAMEWORK['DEFAULT_THROTTLE_RATES']. BACKEND 'local' keeps them in each
+# process; 'cache' (CACHE_ALIAS) or 'database' share them between workers.
+# Run manage.py prune_throttle_buckets periodically with the database backend.
+# Anonymous clients are told apart by address, see TRUSTED_PROXIES.
+THROTTLING = {
+    'BACKEND': os.getenv('THROTTLE_BACKEND', 'local'),
+    'CACHE_ALIAS': os.getenv('THROTTLE_CACHE_ALIAS', 'default'),
+    'LOCAL_MAX_ENTRIES': 100000,
+}